@@ -162,6 +162,19 @@ def format(ctx: Context) -> None:
     ctx.run(tools.ruff.format(*PY_SRC_LIST, config="config/ruff.toml"), title="Formatting code")
 
 
+@duty
+def benchmark(ctx: Context, *cli_args: str) -> None:
+    """Benchmark the extension on synthetic packages.
+
+    Run `python scripts/benchmark.py --help` to see the available options.
+    """
+    ctx.run(
+        [sys.executable, "scripts/benchmark.py", *cli_args],
+        title=pyprefix("Running benchmarks"),
+        capture=False,
+    )
+
+
 @duty
 def build(ctx: Context) -> None:
     """Build source and wheel distributions."""
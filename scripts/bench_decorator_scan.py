@@ -0,0 +1,77 @@
+"""Benchmark decorator scanning: count `callable_path` resolutions per function.
+
+Usage: `python scripts/bench_decorator_scan.py [FUNCTIONS]`.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import Any
+
+import griffe
+
+from griffe_warnings_deprecated import WarningsDeprecatedExtension
+
+_TEMPLATES = (
+    '@functools.cache\n@warnings.deprecated("message {i}")\ndef pep702_{i}(a, b): ...\n',
+    '@utils.deprecated(since="1.0", alternatives=["pkg.new_{i}"])\ndef keywords_{i}(a, b): ...\n',
+    '@utils.deprecated(since="1.0", params=["b"], alternatives={{"b": "c"}})\ndef params_{i}(a, b, c): ...\n',
+    "@functools.cache\n@staticmethod\ndef plain_{i}(a, b): ...\n",
+)
+
+
+def synthetic_module(functions: int) -> str:
+    """Generate the source of a module with many decorated functions.
+
+    Parameters:
+        functions: Number of functions to generate.
+
+    Returns:
+        The module source.
+    """
+    lines = ["import functools", "import warnings", "from braian import utils", ""]
+    lines.extend(_TEMPLATES[i % len(_TEMPLATES)].format(i=i) for i in range(functions))
+    return "\n".join(lines)
+
+
+def main(functions: int = 2000) -> None:
+    """Load the synthetic module and report resolutions and timings.
+
+    Parameters:
+        functions: Number of functions to generate.
+    """
+    counter = {"resolutions": 0}
+    original = griffe.Decorator.callable_path
+
+    def counting_callable_path(self: griffe.Decorator) -> Any:
+        counter["resolutions"] += 1
+        return original.fget(self)  # type: ignore[attr-defined]
+
+    code = synthetic_module(functions)
+    # Griffe resolves each decorator once itself when visiting (overload detection).
+    with griffe.temporary_visited_module(code):
+        pass
+    griffe.Decorator.callable_path = property(counting_callable_path)  # type: ignore[method-assign,assignment]
+    try:
+        counter["resolutions"] = 0
+        with griffe.temporary_visited_module(code):
+            baseline = counter["resolutions"]
+        counter["resolutions"] = 0
+        start = time.perf_counter()
+        extensions = griffe.load_extensions(WarningsDeprecatedExtension)
+        with griffe.temporary_visited_module(code, extensions=extensions):
+            elapsed = time.perf_counter() - start
+            total = counter["resolutions"]
+    finally:
+        griffe.Decorator.callable_path = original  # type: ignore[method-assign]
+
+    extension_resolutions = total - baseline
+    print(f"functions:                      {functions}")
+    print(f"resolutions by the extension:   {extension_resolutions}")
+    print(f"resolutions per function:       {extension_resolutions / functions:.2f}")
+    print(f"load time with the extension:   {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
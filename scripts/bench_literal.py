@@ -0,0 +1,66 @@
+"""Microbenchmarks for the evaluation of constant decorator arguments.
+
+Compare the extension's `Expr` evaluator with the previous approach,
+which called `ast.literal_eval(str(expr))` on each element.
+
+Usage: `python scripts/bench_literal.py [NUMBER]`.
+"""
+
+from __future__ import annotations
+
+import ast
+import sys
+import timeit
+
+import griffe
+
+from griffe_warnings_deprecated.extension import _literal
+
+_CODE = """
+import warnings
+@warnings.deprecated(
+    "message",
+    since="1.0",
+    alternatives=["pkg.module.new", "pkg.module.other"],
+    mapping={"old": "new", "older": "newer"},
+    call=dict(old="new", older="newer"),
+)
+def func(): ...
+"""
+
+
+def _literal_eval(expr: str | griffe.Expr) -> object:
+    if isinstance(expr, griffe.ExprList):
+        return [ast.literal_eval(str(e)) for e in expr.elements]
+    if isinstance(expr, griffe.ExprDict):
+        return dict(zip(map(ast.literal_eval, map(str, expr.keys)), map(ast.literal_eval, map(str, expr.values))))
+    if isinstance(expr, griffe.ExprCall):
+        return {e.name: ast.literal_eval(str(e.value)) for e in expr.arguments if isinstance(e, griffe.ExprKeyword)}
+    return ast.literal_eval(str(expr))
+
+
+def main(number: int = 20_000) -> None:
+    """Time both evaluation paths on each argument shape.
+
+    Parameters:
+        number: Number of evaluations per shape.
+    """
+    with griffe.temporary_visited_module(_CODE) as module:
+        arguments = module["func"].decorators[0].value.arguments  # type: ignore[union-attr]
+    shapes = {
+        "string": arguments[0],
+        "list": arguments[2].value,
+        "dict": arguments[3].value,
+        "dict()": arguments[4].value,
+    }
+    print(f"{'shape':<8} {'literal_eval':>14} {'evaluator':>14} {'speedup':>8}")
+    for name, expr in shapes.items():
+        if _literal(expr) != _literal_eval(expr):
+            raise ValueError(f"The evaluator disagrees with literal_eval on the {name} shape")
+        before = timeit.timeit(lambda expr=expr: _literal_eval(expr), number=number)
+        after = timeit.timeit(lambda expr=expr: _literal(expr), number=number)
+        print(f"{name:<8} {before / number * 1e6:>11.2f} us {after / number * 1e6:>11.2f} us {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
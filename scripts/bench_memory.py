@@ -0,0 +1,81 @@
+"""Benchmark the memory retained by the extension for deprecated objects.
+
+Load a synthetic package where every class, method and function is deprecated,
+and compare the memory still allocated after loading, with and without the extension.
+
+Usage: `python scripts/bench_memory.py [OBJECTS] [--lazy] [--parse]`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+import griffe
+from benchmark import Synthetic, _iterate, generate
+
+from griffe_warnings_deprecated import WarningsDeprecatedExtension
+
+
+def retained(package: Path, options: dict[str, Any] | None, *, parse: bool) -> tuple[int, int]:
+    """Load a package and measure the memory it retains.
+
+    Parameters:
+        package: The package directory.
+        options: Extension options, or `None` to load without the extension.
+        parse: Whether to parse every docstring after loading.
+
+    Returns:
+        The retained memory in bytes, and the number of deprecated objects.
+    """
+    gc.collect()
+    tracemalloc.start()
+    extensions = griffe.load_extensions(WarningsDeprecatedExtension(**options)) if options is not None else None
+    module = griffe.load(
+        package.name,
+        search_paths=[package.parent],
+        extensions=extensions,
+        docstring_parser="google",
+        resolve_aliases=False,
+    )
+    objects = list(_iterate(module))
+    if parse:
+        for obj in objects:
+            if obj.docstring:
+                obj.docstring.parsed  # noqa: B018
+    gc.collect()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return memory, sum(1 for obj in objects if obj.deprecated)
+
+
+def main(args: list[str] | None = None) -> None:
+    """Run the benchmark.
+
+    Parameters:
+        args: Command-line arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("objects", nargs="?", type=int, default=50_000, help="Number of deprecated objects.")
+    parser.add_argument("--lazy", action="store_true", help="Enable lazy docstring edits.")
+    parser.add_argument("--parse", action="store_true", help="Parse every docstring after loading.")
+    opts = parser.parse_args(args)
+    # Modules and class docstrings aside, every object is deprecated.
+    synthetic = Synthetic.of_size(opts.objects * 52 // 50, density=1.0, styles=["pep702", "keywords"])
+    with tempfile.TemporaryDirectory() as tmpdir:
+        package = generate(synthetic, Path(tmpdir))
+        without, _ = retained(package, None, parse=opts.parse)
+        with_extension, deprecated = retained(package, {"lazy": opts.lazy}, parse=opts.parse)
+    extra = with_extension - without
+    print(f"deprecated objects:       {deprecated}")
+    print(f"retained without:         {without / 2**20:.1f} MiB")
+    print(f"retained with extension:  {with_extension / 2**20:.1f} MiB ({extra / 2**20:+.1f} MiB)")
+    print(f"per deprecated object:    {extra / max(deprecated, 1):.0f} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark the annotation of deprecated parameters on heavily parameterized functions.
+
+Compare the name-indexed single pass with the previous approach,
+which walked every section and every documented parameter once per deprecated parameter.
+
+Usage: `python scripts/bench_param_notes.py [PARAMETERS] [DEPRECATED]`.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import Callable
+
+import griffe
+
+from griffe_warnings_deprecated.extension import _annotate_params, _deprecate_param
+
+
+def _previous(sections: list[griffe.DocstringSection], messages: dict[str, str]) -> None:
+    for name, message in messages.items():
+        for section in sections:
+            if isinstance(section, griffe.DocstringSectionParameters):
+                for param in section.value:
+                    if param.name == name:
+                        param.description = message + param.description
+
+
+def _docstring(parameters: int) -> str:
+    half = parameters // 2
+    params = "\n".join(f"    p{i}: Parameter {i}." for i in range(half))
+    others = "\n".join(f"    p{i}: Parameter {i}." for i in range(half, parameters))
+    return f"Summary.\n\nParameters:\n{params}\n\nOther Parameters:\n{others}\n\nReturns:\n    int: Something."
+
+
+def main(parameters: int = 60, deprecated: int = 20, number: int = 2000) -> None:
+    """Time both approaches on one parsed docstring.
+
+    Parameters:
+        parameters: Number of documented parameters.
+        deprecated: Number of deprecated parameters.
+        number: Number of repetitions.
+    """
+    docstring = griffe.Docstring(_docstring(parameters), parser="google")
+    step = max(1, parameters // deprecated)
+    messages = {f"p{i}": _deprecate_param("1.0", f"p{i + 1}") for i in range(0, parameters, step)}
+
+    def run(approach: Callable[[list[griffe.DocstringSection], dict[str, str]], None]) -> float:
+        total = 0.0
+        for _ in range(number):
+            # Parse outside of the timed code, since both approaches share that cost.
+            sections = docstring.parse()
+            start = time.perf_counter()
+            approach(sections, messages)
+            total += time.perf_counter() - start
+        return total / number
+
+    before = run(_previous)
+    after = run(_annotate_params)
+    print(f"documented parameters:  {parameters}")
+    print(f"deprecated parameters:  {len(messages)}")
+    print(f"previous approach:      {before * 1e6:.1f} us per function")
+    print(f"name-indexed approach:  {after * 1e6:.1f} us per function ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
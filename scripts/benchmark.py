@@ -0,0 +1,287 @@
+"""Benchmark the extension on synthetic packages.
+
+Generate a package with a configurable number of modules, classes and functions,
+a configurable density and style of deprecation decorators and configurable docstring sizes,
+then time `griffe.load` with and without the extension, and report the per-object overhead
+and the peak memory of each configuration.
+
+Usage: `python scripts/benchmark.py --size 10k --output bench.json`.
+The `benchmark` duty runs this script too.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import griffe
+
+from griffe_warnings_deprecated import WarningsDeprecatedExtension
+from griffe_warnings_deprecated.debug import get_version
+
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1M": 1_000_000}
+"""Preset package sizes, in number of objects."""
+
+STYLES = {
+    "pep702": '@warnings.deprecated("{name} is deprecated.", category=DeprecationWarning)',
+    "keywords": '@utils.deprecated(since="1.{index}", message="Use something else.", alternatives=["pkg.mod0.f0"])',
+    "params": '@utils.deprecated(since="1.{index}", params=["b"], alternatives={{"b": "c"}})',
+}
+"""Decorator styles, formatted with the object name and index."""
+
+
+@dataclass
+class Synthetic:
+    """Parameters of a synthetic package."""
+
+    modules: int = 20
+    """Number of modules."""
+    classes: int = 10
+    """Number of classes per module."""
+    methods: int = 4
+    """Number of methods per class."""
+    functions: int = 10
+    """Number of functions per module."""
+    density: float = 0.1
+    """Fraction of classes and functions decorated with a deprecation decorator."""
+    styles: list[str] = field(default_factory=lambda: list(STYLES))
+    """Decorator styles, used in turn."""
+    docstring_lines: int = 5
+    """Number of lines in each docstring."""
+    seed: int = 0
+    """Seed used to choose the decorated objects."""
+
+    @property
+    def objects(self) -> int:
+        """Total number of objects (modules, classes, methods and functions)."""
+        return self.modules * (1 + self.classes * (1 + self.methods) + self.functions)
+
+    @classmethod
+    def of_size(cls, objects: int, **kwargs: Any) -> Synthetic:
+        """Create parameters with enough modules to reach a number of objects.
+
+        Parameters:
+            objects: Approximate number of objects.
+            **kwargs: Other parameters.
+
+        Returns:
+            The parameters.
+        """
+        synthetic = cls(**kwargs)
+        per_module = synthetic.objects // synthetic.modules
+        synthetic.modules = max(1, round(objects / per_module))
+        return synthetic
+
+
+def _docstring(lines: int, indent: str, *, params: bool = True) -> str:
+    body = [f"Summary line {i}." if not i else f"{indent}Description line {i}." for i in range(lines)]
+    section = f"\n\n{indent}Parameters:\n{indent}    a: A.\n{indent}    b: B.\n{indent}    c: C.\n{indent}" if params else ""
+    return f'{indent}"""{chr(10).join(body)}{section}"""\n'
+
+
+def generate(synthetic: Synthetic, directory: Path, name: str = "synthetic_pkg") -> Path:
+    """Write a synthetic package.
+
+    Parameters:
+        synthetic: The package parameters.
+        directory: The parent directory.
+        name: The package name.
+
+    Returns:
+        The package directory.
+    """
+    rng = random.Random(synthetic.seed)  # noqa: S311
+    package = directory / name
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text('"""Synthetic package."""\n', encoding="utf8")
+    decorated = 0
+
+    def decorator(obj_name: str, indent: str = "") -> str:
+        nonlocal decorated
+        if not synthetic.styles or rng.random() >= synthetic.density:
+            return ""
+        style = synthetic.styles[decorated % len(synthetic.styles)]
+        decorated += 1
+        return f"{indent}{STYLES[style].format(name=obj_name, index=decorated % 10)}\n"
+
+    for module_index in range(synthetic.modules):
+        chunks = ["import functools\nimport warnings\n\nfrom braian import utils\n\n"]
+        for class_index in range(synthetic.classes):
+            class_name = f"C{class_index}"
+            chunks.append(f"{decorator(class_name)}class {class_name}:\n{_docstring(synthetic.docstring_lines, '    ', params=False)}")
+            for method_index in range(synthetic.methods):
+                method = f"m{method_index}"
+                chunks.append(
+                    f"\n    @functools.cache\n{decorator(method, '    ')}    def {method}(self, a: int, b: int, c: int):\n"
+                    f"{_docstring(synthetic.docstring_lines, '        ')}",
+                )
+            chunks.append("\n\n")
+        for function_index in range(synthetic.functions):
+            function = f"f{function_index}"
+            chunks.append(
+                f"{decorator(function)}def {function}(a: int, b: int, c: int):\n{_docstring(synthetic.docstring_lines, '    ')}\n\n",
+            )
+        (package / f"mod{module_index}.py").write_text("".join(chunks), encoding="utf8")
+    return package
+
+
+def _load(package: Path, options: dict[str, Any] | None, *, parse: bool) -> float:
+    extensions = griffe.load_extensions(WarningsDeprecatedExtension(**options)) if options is not None else None
+    start = time.perf_counter()
+    module = griffe.load(
+        package.name,
+        search_paths=[package.parent],
+        extensions=extensions,
+        docstring_parser="google",
+        resolve_aliases=False,
+    )
+    if parse:
+        for obj in _iterate(module):
+            if obj.docstring:
+                obj.docstring.parsed  # noqa: B018
+    return time.perf_counter() - start
+
+
+def _iterate(obj: griffe.Object) -> Any:
+    yield obj
+    for member in obj.members.values():
+        if not member.is_alias:
+            yield from _iterate(member)  # type: ignore[arg-type]
+
+
+def measure(
+    package: Path,
+    options: dict[str, Any] | None,
+    *,
+    repeat: int = 3,
+    parse: bool = False,
+    memory: bool = True,
+) -> dict[str, float]:
+    """Measure the time and peak memory of loading a package.
+
+    Parameters:
+        package: The package directory.
+        options: Extension options, or `None` to load without the extension.
+        repeat: Number of timed loads (the best time is kept).
+        parse: Whether to also parse every docstring, like a full documentation build would.
+        memory: Whether to measure peak memory (in an additional load).
+
+    Returns:
+        The best time in seconds, and the peak memory in bytes.
+    """
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        times.append(_load(package, options, parse=parse))
+    result = {"time": min(times)}
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        _load(package, options, parse=parse)
+        result["peak_memory"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result
+
+
+def run(synthetic: Synthetic, options: dict[str, Any], **kwargs: Any) -> dict[str, Any]:
+    """Generate a package and benchmark it with and without the extension.
+
+    Parameters:
+        synthetic: The package parameters.
+        options: Extension options.
+        **kwargs: Parameters passed to [`measure`][benchmark.measure].
+
+    Returns:
+        The benchmark results.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        package = generate(synthetic, Path(tmpdir))
+        without = measure(package, None, **kwargs)
+        with_extension = measure(package, options, **kwargs)
+    overhead = with_extension["time"] - without["time"]
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "griffe": get_version("griffe"),
+            "griffe-warnings-deprecated": get_version(),
+        },
+        "synthetic": asdict(synthetic),
+        "objects": synthetic.objects,
+        "options": options,
+        "without_extension": without,
+        "with_extension": with_extension,
+        "overhead": overhead,
+        "overhead_per_object_us": overhead / synthetic.objects * 1e6,
+    }
+
+
+def _report(results: dict[str, Any], baseline: dict[str, Any] | None) -> None:
+    without, with_extension = results["without_extension"], results["with_extension"]
+    print(f"objects:                  {results['objects']}")
+    print(f"load without extension:   {without['time']:.3f} s")
+    print(f"load with extension:      {with_extension['time']:.3f} s")
+    print(f"overhead per object:      {results['overhead_per_object_us']:.2f} us")
+    if "peak_memory" in with_extension:
+        extra = (with_extension["peak_memory"] - without["peak_memory"]) / 2**20
+        print(f"peak memory:              {with_extension['peak_memory'] / 2**20:.1f} MiB ({extra:+.1f} MiB)")
+    if baseline:
+        before, after = baseline["overhead_per_object_us"], results["overhead_per_object_us"]
+        print(f"baseline overhead:        {before:.2f} us per object ({after - before:+.2f} us)")
+
+
+def main(args: list[str] | None = None) -> int:
+    """Run the benchmark from the command line.
+
+    Parameters:
+        args: Command-line arguments.
+
+    Returns:
+        An exit code.
+    """
+    parser = argparse.ArgumentParser(prog="benchmark", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size", choices=SIZES, help="Preset package size (overrides --modules).")
+    parser.add_argument("--modules", type=int, default=Synthetic.modules, help="Number of modules.")
+    parser.add_argument("--classes", type=int, default=Synthetic.classes, help="Classes per module.")
+    parser.add_argument("--methods", type=int, default=Synthetic.methods, help="Methods per class.")
+    parser.add_argument("--functions", type=int, default=Synthetic.functions, help="Functions per module.")
+    parser.add_argument("--density", type=float, default=Synthetic.density, help="Fraction of deprecated objects.")
+    parser.add_argument("--styles", default=",".join(STYLES), help=f"Decorator styles among: {', '.join(STYLES)}.")
+    parser.add_argument("--docstring-lines", type=int, default=Synthetic.docstring_lines, help="Docstring size.")
+    parser.add_argument("--option", action="append", default=[], help="Extension option, as KEY=JSON_VALUE.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed loads per configuration.")
+    parser.add_argument("--parse", action="store_true", help="Also parse every docstring after loading.")
+    parser.add_argument("--no-memory", action="store_true", help="Don't measure peak memory.")
+    parser.add_argument("--output", help="Write JSON results to this file.")
+    parser.add_argument("--compare", help="Compare with JSON results of a previous run.")
+    opts = parser.parse_args(args)
+
+    params = {
+        "classes": opts.classes,
+        "methods": opts.methods,
+        "functions": opts.functions,
+        "density": opts.density,
+        "styles": [style for style in opts.styles.split(",") if style],
+        "docstring_lines": opts.docstring_lines,
+    }
+    synthetic = Synthetic.of_size(SIZES[opts.size], **params) if opts.size else Synthetic(opts.modules, **params)
+    options = {key: json.loads(value) for key, value in (option.split("=", 1) for option in opts.option)}
+    results = run(synthetic, options, repeat=opts.repeat, parse=opts.parse, memory=not opts.no_memory)
+    baseline = json.loads(Path(opts.compare).read_text(encoding="utf8")) if opts.compare else None
+    _report(results, baseline)
+    if opts.output:
+        Path(opts.output).write_text(json.dumps(results, indent=2), encoding="utf8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
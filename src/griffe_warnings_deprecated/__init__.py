@@ -5,6 +5,14 @@ Griffe extension for `@warnings.deprecated` (PEP 702).
 
 from __future__ import annotations
 
-from griffe_warnings_deprecated.extension import WarningsDeprecatedExtension
+from griffe_warnings_deprecated.extension import DeprecationInfo, WarningsDeprecatedExtension, deprecation_info
+from griffe_warnings_deprecated.policy import RemovalPolicy
+from griffe_warnings_deprecated.stats import ExtensionStats
 
-__all__: list[str] = ["WarningsDeprecatedExtension"]
+__all__: list[str] = [
+    "DeprecationInfo",
+    "ExtensionStats",
+    "RemovalPolicy",
+    "WarningsDeprecatedExtension",
+    "deprecation_info",
+]
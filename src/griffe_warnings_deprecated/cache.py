@@ -0,0 +1,100 @@
+"""On-disk cache of the deprecations extracted from modules."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from griffe import get_logger
+
+from griffe_warnings_deprecated.debug import get_version
+
+logger = get_logger(__name__)
+
+CACHE_VERSION = 3
+"""Version of the cache format. Bump it when the records change shape."""
+
+
+class DeprecationCache:
+    """Store the deprecation records of each module in a cache directory.
+
+    There is one small JSON file per module path (e.g. `package.module`),
+    so that entries are shared between checkouts of the same project in different directories.
+    Each file records a key computed from the module source, the extension version,
+    the cache format version and the extraction options:
+    a file whose key doesn't match is treated as a miss and overwritten.
+    """
+
+    def __init__(self, directory: str | Path, *options: object) -> None:
+        """Initialize the cache.
+
+        Parameters:
+            directory: The cache directory. It is created if needed.
+            *options: Extension options that affect the extracted records.
+        """
+        self.directory = Path(directory)
+        """The cache directory."""
+        self.fingerprint = json.dumps([CACHE_VERSION, get_version(), *options], default=str)
+        """String identifying the extension version and options."""
+        self.hits = 0
+        """Number of modules whose records were read from the cache."""
+        self.misses = 0
+        """Number of modules whose records had to be extracted."""
+
+    def key(self, source: str) -> str:
+        """Compute the key of a module source.
+
+        Parameters:
+            source: The module source.
+
+        Returns:
+            A hexadecimal digest.
+        """
+        digest = hashlib.sha256(self.fingerprint.encode())
+        digest.update(b"\0")
+        digest.update(source.encode())
+        return digest.hexdigest()
+
+    def _entry(self, module: str) -> Path:
+        return self.directory / f"{hashlib.sha256(module.encode()).hexdigest()[:32]}.json"
+
+    def load(self, module: str, key: str) -> dict[str, dict[str, Any]] | None:
+        """Load the records of a module.
+
+        Parameters:
+            module: The module path.
+            key: The key of the module source, see [`key`][griffe_warnings_deprecated.cache.DeprecationCache.key].
+
+        Returns:
+            The records, by object path, or `None` if the cache has no valid entry.
+        """
+        try:
+            with self._entry(module).open(encoding="utf8") as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            entry = None
+        if not isinstance(entry, dict) or entry.get("key") != key:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry["records"]
+
+    def save(self, module: str, key: str, records: dict[str, dict[str, Any]]) -> None:
+        """Save the records of a module.
+
+        Parameters:
+            module: The module path.
+            key: The key of the module source, see [`key`][griffe_warnings_deprecated.cache.DeprecationCache.key].
+            records: The records, by object path.
+        """
+        entry = self._entry(module)
+        tmp = entry.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps({"key": key, "records": records}, separators=(",", ":")), encoding="utf8")
+            tmp.replace(entry)
+        except OSError as error:
+            logger.debug(f"Could not write deprecation cache entry for {module}: {error}")
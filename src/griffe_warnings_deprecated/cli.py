@@ -0,0 +1,290 @@
+"""Command-line interface to scan packages for deprecations.
+
+Run `griffe-deprecations --help` to see the available commands.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import griffe
+
+from griffe_warnings_deprecated.debug import get_version
+from griffe_warnings_deprecated.diff import diff_refs
+from griffe_warnings_deprecated.extension import WarningsDeprecatedExtension
+from griffe_warnings_deprecated.inventory import write_inventory
+from griffe_warnings_deprecated.policy import RemovalPolicy
+from griffe_warnings_deprecated.usages import DeprecationIndex, find_usages
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+def _extension_options(opts: argparse.Namespace) -> dict[str, Any]:
+    options: dict[str, Any] = {"lazy": True}
+    if opts.decorators:
+        options["decorators"] = opts.decorators
+    if opts.cache_dir:
+        options["cache_dir"] = opts.cache_dir
+    return options
+
+
+def scan_package(package: str, search_paths: Sequence[str], options: dict[str, Any]) -> list[dict[str, Any]]:
+    """Load a package with the extension and return its deprecation records.
+
+    Parameters:
+        package: The package name.
+        search_paths: Paths to search the package into (in addition to `sys.path`).
+        options: Options of the extension.
+
+    Returns:
+        The deprecation records, sorted by path.
+    """
+    extension = WarningsDeprecatedExtension(**options)
+    loaded = griffe.load(
+        package,
+        search_paths=[*search_paths, *sys.path],
+        extensions=griffe.load_extensions(extension),
+        resolve_aliases=False,
+    )
+    return sorted(extension.records(loaded.path), key=lambda record: record["path"])
+
+
+def scan_packages(
+    packages: Sequence[str],
+    search_paths: Sequence[str] = (),
+    options: dict[str, Any] | None = None,
+    workers: int | None = None,
+    *,
+    progress: bool = False,
+) -> tuple[list[dict[str, Any]], dict[str, str]]:
+    """Scan several packages, in a process pool.
+
+    The merged report only depends on the packages, not on the order in which workers finish.
+
+    Parameters:
+        packages: The package names.
+        search_paths: Paths to search the packages into (in addition to `sys.path`).
+        options: Options of the extension.
+        workers: Number of worker processes. With one worker, packages are scanned in this process.
+        progress: Whether to print progress on standard error.
+
+    Returns:
+        The records of all packages sorted by path, and the errors by package.
+    """
+    options = options or {}
+    packages = sorted(set(packages))
+    results: dict[str, list[dict[str, Any]]] = {}
+    errors: dict[str, str] = {}
+
+    def done(package: str, records: list[dict[str, Any]] | None, error: BaseException | None) -> None:
+        if error is None:
+            results[package] = records or []
+        else:
+            errors[package] = f"{error.__class__.__name__}: {error}"
+        if progress:
+            status = f"{len(records or [])} deprecations" if error is None else "failed"
+            print(f"[{len(results) + len(errors)}/{len(packages)}] {package}: {status}", file=sys.stderr)
+
+    workers = min(workers or os.cpu_count() or 1, len(packages))
+    if workers <= 1:
+        for package in packages:
+            try:
+                records = scan_package(package, search_paths, options)
+            except Exception as error:  # noqa: BLE001
+                done(package, None, error)
+            else:
+                done(package, records, None)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(scan_package, package, search_paths, options): package for package in packages}
+            for future in as_completed(futures):
+                exc = future.exception()
+                done(futures[future], None if exc else future.result(), exc)
+
+    records = [record for package in packages for record in results.get(package, ())]
+    records.sort(key=lambda record: record["path"])
+    return records, errors
+
+
+def _scan(opts: argparse.Namespace) -> int:
+    records, errors = scan_packages(
+        opts.packages,
+        opts.search,
+        _extension_options(opts),
+        opts.workers,
+        progress=not opts.quiet,
+    )
+    write_inventory(opts.output or sys.stdout, records)
+    for package, error in errors.items():
+        print(f"error: could not scan {package}: {error}", file=sys.stderr)
+    return 1 if errors else 0
+
+
+def _check(opts: argparse.Namespace) -> int:
+    try:
+        policy = RemovalPolicy(opts.current_version, opts.after, opts.part)
+    except ValueError as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 2
+    records, errors = scan_packages(
+        opts.packages,
+        opts.search,
+        _extension_options(opts),
+        opts.workers,
+        progress=not opts.quiet,
+    )
+    overdue = 0
+    for item in policy.overdue(records):
+        print(policy.describe(item))
+        overdue += 1
+    for package, exc in errors.items():
+        print(f"error: could not scan {package}: {exc}", file=sys.stderr)
+    if not opts.quiet:
+        print(f"{overdue} deprecations past their removal version ({opts.current_version})", file=sys.stderr)
+    return 1 if overdue or errors else 0
+
+
+def _usages(opts: argparse.Namespace) -> int:
+    index = DeprecationIndex.from_inventory(opts.index)
+    output = open(opts.output, "w", encoding="utf8") if opts.output else sys.stdout  # noqa: SIM115
+    found = failed = 0
+    try:
+        for filepath, usages, error in find_usages(index, opts.paths, opts.workers):
+            if error:
+                failed += 1
+                print(f"error: could not scan {filepath}: {error}", file=sys.stderr)
+            for usage in usages:
+                output.write(json.dumps(usage) + "\n")
+            found += len(usages)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    if not opts.quiet:
+        print(f"{found} usages of deprecated APIs, {failed} files not scanned", file=sys.stderr)
+    return 1 if found else 0
+
+
+def _diff(opts: argparse.Namespace) -> int:
+    differences = diff_refs(
+        opts.package,
+        opts.old_ref,
+        opts.new_ref,
+        repo=opts.repo,
+        search_paths=opts.search or None,
+        options=_extension_options(opts),
+    )
+    text = json.dumps(differences, indent=2)
+    if opts.output:
+        Path(opts.output).write_text(text, encoding="utf8")
+    else:
+        print(text)
+    if not opts.quiet:
+        summary = ", ".join(f"{len(records)} {kind}" for kind, records in differences.items())
+        print(f"{opts.package} {opts.old_ref}..{opts.new_ref}: {summary}", file=sys.stderr)
+    return 0
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Return the CLI argument parser.
+
+    Returns:
+        An argparse parser.
+    """
+    parser = argparse.ArgumentParser(prog="griffe-deprecations", description="Report deprecated APIs of packages.")
+    parser.add_argument("-V", "--version", action="version", version=f"%(prog)s {get_version()}")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "-s",
+        "--search",
+        action="append",
+        default=[],
+        help="Paths to search packages into (relative to the repository root for diff).",
+    )
+    common.add_argument("-q", "--quiet", action="store_true", help="Don't print progress.")
+    common.add_argument(
+        "-d",
+        "--decorator",
+        dest="decorators",
+        action="append",
+        help="Path of a deprecation decorator (replaces the default ones, can be repeated).",
+    )
+    common.add_argument("-c", "--cache-dir", help="Directory in which to cache the deprecations of each module.")
+
+    scan = subparsers.add_parser("scan", parents=[common], help="List the deprecated APIs of packages.")
+    scan.add_argument("packages", nargs="+", help="Packages to scan.")
+    scan.add_argument("-j", "--workers", type=int, help="Number of worker processes (default: number of CPUs).")
+    scan.add_argument("-o", "--output", help="Write the report to this file (JSON, or JSONL with a .jsonl suffix).")
+    scan.set_defaults(func=_scan)
+
+    check = subparsers.add_parser(
+        "check",
+        parents=[common],
+        help="List the deprecated APIs that should have been removed, and exit with status 1 if there are any.",
+    )
+    check.add_argument("current_version", metavar="VERSION", help="Current version of the project.")
+    check.add_argument("packages", nargs="+", help="Packages to check.")
+    check.add_argument("-j", "--workers", type=int, help="Number of worker processes (default: number of CPUs).")
+    check.add_argument(
+        "-a",
+        "--after",
+        type=int,
+        default=1,
+        help="Number of versions after which deprecated APIs must be removed (default: 1).",
+    )
+    check.add_argument(
+        "-p",
+        "--part",
+        choices=["major", "minor", "patch"],
+        default="minor",
+        help="Version part the --after option applies to (default: minor).",
+    )
+    check.set_defaults(func=_check)
+
+    usages = subparsers.add_parser(
+        "usages",
+        help="Find usages of deprecated APIs in source trees, and exit with status 1 if there are any.",
+    )
+    usages.add_argument("index", help="Report of the scan command (JSON or JSONL).")
+    usages.add_argument("paths", nargs="+", help="Files and directories to scan.")
+    usages.add_argument("-j", "--workers", type=int, help="Number of worker processes (default: number of CPUs).")
+    usages.add_argument("-o", "--output", help="Write the usages to this file (JSON lines).")
+    usages.add_argument("-q", "--quiet", action="store_true", help="Don't print a summary.")
+    usages.set_defaults(func=_usages)
+
+    diff = subparsers.add_parser(
+        "diff",
+        parents=[common],
+        help="List the APIs deprecated, un-deprecated or changed between two git references.",
+    )
+    diff.add_argument("package", help="Package to compare.")
+    diff.add_argument("old_ref", help="Old git reference.")
+    diff.add_argument("new_ref", nargs="?", default="HEAD", help="New git reference (default: HEAD).")
+    diff.add_argument("-r", "--repo", default=".", help="Git repository (default: current directory).")
+    diff.add_argument("-o", "--output", help="Write the JSON report to this file.")
+    diff.set_defaults(func=_diff)
+    return parser
+
+
+def main(args: list[str] | None = None) -> int:
+    """Run the main program.
+
+    This function is executed when you type `griffe-deprecations` or `python -m griffe_warnings_deprecated`.
+
+    Parameters:
+        args: Arguments passed from the command line.
+
+    Returns:
+        An exit code.
+    """
+    parser = get_parser()
+    opts = parser.parse_args(args=args)
+    return opts.func(opts)
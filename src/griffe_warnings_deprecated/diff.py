@@ -0,0 +1,131 @@
+"""Compare the deprecations of a package between two git references."""
+
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import griffe
+
+from griffe_warnings_deprecated.extension import WarningsDeprecatedExtension
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from griffe import Module
+
+_COMPARED_FIELDS = ("message", "since", "alternatives", "params")
+
+
+def load_git_records(
+    package: str,
+    ref: str,
+    repo: str | Path = ".",
+    search_paths: Sequence[str | Path] | None = None,
+    options: dict[str, Any] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Load a package at a given git reference and return its deprecation records.
+
+    Parameters:
+        package: The package name.
+        ref: The git reference (commit, branch, tag).
+        repo: The git repository.
+        search_paths: Paths to search the package into, relative to the repository root.
+        options: Options of the extension.
+
+    Returns:
+        The records, by object path. File paths are relative to the repository root,
+        since the temporary worktree the package was loaded from is removed.
+    """
+    extension = WarningsDeprecatedExtension(**(options or {}))
+    loaded = griffe.load_git(
+        package,
+        ref=ref,
+        repo=repo,
+        search_paths=search_paths,
+        extensions=griffe.load_extensions(extension),
+        resolve_aliases=False,
+    )
+    root = _worktree_root(loaded, search_paths)  # type: ignore[arg-type]
+    records = extension.records(loaded.path)
+    for record in records:
+        filepath = Path(record["filepath"])
+        if filepath.is_absolute() and filepath.is_relative_to(root):
+            record["filepath"] = filepath.relative_to(root).as_posix()
+    return {record["path"]: record for record in records}
+
+
+def _worktree_root(package: Module, search_paths: Sequence[str | Path] | None) -> Path:
+    # The worktree is gone once loaded: find its root from the directory the package was found in,
+    # by removing the search path (relative to the repository root) that ends this directory.
+    filepath = package.filepath
+    if isinstance(filepath, list):  # Namespace package: its directories.
+        search_dir = filepath[0].parent
+    else:
+        search_dir = filepath.parent.parent if package.is_init_module else filepath.parent
+    candidates = [Path(path).parts for path in search_paths or ["."]]
+    for parts in sorted((tuple(part for part in parts if part != ".") for parts in candidates), key=len, reverse=True):
+        if not parts or search_dir.parts[-len(parts) :] == parts:
+            return Path(*search_dir.parts[: len(search_dir.parts) - len(parts)])
+    return search_dir
+
+
+def diff_records(old: dict[str, dict[str, Any]], new: dict[str, dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+    """Compare two sets of deprecation records.
+
+    Parameters:
+        old: The old records, by object path.
+        new: The new records, by object path.
+
+    Returns:
+        Records that became deprecated, that were un-deprecated,
+        and that changed (message, `since` version, alternatives or parameters), each sorted by path.
+    """
+    changed = []
+    for path in sorted(old.keys() & new.keys()):
+        before = {field: old[path][field] for field in _COMPARED_FIELDS}
+        after = {field: new[path][field] for field in _COMPARED_FIELDS}
+        if before != after:
+            changed.append({"path": path, "before": before, "after": after})
+    return {
+        "deprecated": [new[path] for path in sorted(new.keys() - old.keys())],
+        "undeprecated": [old[path] for path in sorted(old.keys() - new.keys())],
+        "changed": changed,
+    }
+
+
+def diff_refs(
+    package: str,
+    old_ref: str,
+    new_ref: str = "HEAD",
+    *,
+    repo: str | Path = ".",
+    search_paths: Sequence[str | Path] | None = None,
+    options: dict[str, Any] | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Compare the deprecations of a package between two git references.
+
+    Both references are loaded with the same deprecation cache
+    (a temporary one unless `cache_dir` is given in the options),
+    so the decorators of modules that didn't change between the references are only scanned once.
+    Each reference is still fully loaded by Griffe: this mostly saves time on packages with many decorators.
+
+    Parameters:
+        package: The package name.
+        old_ref: The old git reference.
+        new_ref: The new git reference.
+        repo: The git repository.
+        search_paths: Paths to search the package into, relative to the repository root.
+        options: Options of the extension.
+
+    Returns:
+        The differences, see [`diff_records`][griffe_warnings_deprecated.diff.diff_records].
+    """
+    options = dict(options or {})
+    options.setdefault("lazy", True)
+    with tempfile.TemporaryDirectory(prefix="griffe-deprecations-") as tmpdir:
+        options.setdefault("cache_dir", tmpdir)
+        old = load_git_records(package, old_ref, repo, search_paths, options)
+        new = load_git_records(package, new_ref, repo, search_paths, options)
+    return diff_records(old, new)
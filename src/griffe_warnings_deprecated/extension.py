@@ -3,16 +3,34 @@
 from __future__ import annotations
 
 import ast
-from collections.abc import Sequence
+import fnmatch
+import logging
+import re
+import sys
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from functools import cached_property
+from types import MappingProxyType
 from typing import Any
 
-from griffe import Class, Docstring, DocstringSectionAdmonition, DocstringSectionParameters, Expr, ExprCall, ExprDict, ExprKeyword, Extension, Function, Parameter, get_logger
+from griffe import Attribute, Class, Decorator, Docstring, DocstringParameter, DocstringSection, DocstringSectionAdmonition, DocstringSectionOtherParameters, DocstringSectionParameters, Expr, ExprAttribute, ExprCall, ExprDict, ExprKeyword, ExprList, ExprName, Extension, Function, Inspector, Module, Object, ObjectNode, ParameterKind, Visitor, get_logger, safe_get_expression
+
+from griffe_warnings_deprecated.cache import DeprecationCache
+from griffe_warnings_deprecated.inventory import deprecation_record, write_inventory
+from griffe_warnings_deprecated.parsers import (
+    BUILTIN_PARSERS,
+    DecoratorParser,
+    entry_point_parsers,
+    load_parser,
+    parse_keywords,
+)
+from griffe_warnings_deprecated.policy import RemovalPolicy
+from griffe_warnings_deprecated.stats import ExtensionStats
 
 logger = get_logger(__name__)
 self_namespace = "griffe_warnings_deprecated"
 mkdocstrings_namespace = "mkdocstrings"
 
-_decorators = {"warnings.deprecated", "typing_extensions.deprecated", "braian.utils.deprecated"}
+_warning_categories = frozenset({"DeprecationWarning", "PendingDeprecationWarning", "FutureWarning"})
 
 def _object_anchestry(obj: Class) -> list[str]:
     import_name = []
@@ -27,83 +45,793 @@ def _remove_common_anchestors(package_path: str, other_anchestry: list[str]):
     common = [a1 for a1,a2 in zip(anchestry,other_anchestry) if a1==a2]
     return ".".join(anchestry[len(common):])
 
-def _deprecate_param(since: str, alternative: str|None) -> str:
-    message = f"""**Deprecated since {since}**"""
+def _deprecate_param(since: str | None, alternative: str|None) -> str:
+    message = f"""**Deprecated since {since}**""" if since else "**Deprecated**"
     if alternative:
         return message+f": use `{alternative}` instead.\n\n"
     return message+"\n\n"
 
-def _braian_deprecate_params(obj: Function) -> dict[str,str]:
-    since = None
-    params = []
-    alternatives = dict()
-    for decorator in obj.decorators:
-        if decorator.callable_path not in _decorators or not isinstance(decorator.value, ExprCall):
-            continue
-        for arg in decorator.value:
-            if not isinstance(arg, ExprKeyword):
-                continue
+def _intern(string: str | None) -> str | None:
+    return sys.intern(string) if isinstance(string, str) else string
+
+_no_params: Mapping[str, tuple[str | None, str | None]] = MappingProxyType({})
+
+class DeprecationInfo:
+    """Deprecation data of an object.
+
+    It is stored once per object, in `obj.extra["griffe_warnings_deprecated"]["deprecation"]`,
+    unless the object is only deprecated with a message: the message is already its `deprecated` attribute,
+    and the data is rebuilt from it on demand by [`deprecation_info`][griffe_warnings_deprecated.deprecation_info],
+    sparing the `extra` namespace dictionary, which costs more than the record itself.
+    Instances are slotted, and versions, alternatives and categories are interned,
+    since many objects share them. The deprecation text is rendered once, when the object is deprecated,
+    and shared by its `deprecated` attribute and its admonition.
+    """
+
+    __slots__ = ("alternatives", "category", "message", "params", "since")
+
+    def __init__(
+        self,
+        message: str | None = None,
+        since: str | None = None,
+        alternatives: Iterable[str] = (),
+        params: Mapping[str, tuple[str | None, str | None]] | None = None,
+        category: str | None = None,
+    ) -> None:
+        """Initialize the deprecation data.
+
+        Parameters:
+            message: Deprecation message.
+            since: Version since which the whole object is deprecated.
+            alternatives: Paths of the objects to use instead.
+            params: Deprecated parameters, mapped to the version they were deprecated in and their alternative.
+            category: Warning category, as written in the code.
+        """
+        self.message = message
+        """Deprecation message (positional PEP 702 message, or `message=` keyword)."""
+        self.since = _intern(since)
+        """Version since which the whole object is deprecated (keyword style only)."""
+        self.alternatives: tuple[str, ...] = tuple(map(sys.intern, alternatives))
+        """Paths of the objects to use instead."""
+        self.params: Mapping[str, tuple[str | None, str | None]] = _no_params
+        """Deprecated parameters, mapped to the version they were deprecated in and their alternative."""
+        self.category = _intern(category)
+        """Warning category, as written in the code (e.g. `DeprecationWarning`)."""
+        if params:
+            self.update({"params": params})
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.as_dict().items())
+        return f"{self.__class__.__name__}({fields})"
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DeprecationInfo:
+        """Rebuild deprecation data serialized with [`as_dict`][griffe_warnings_deprecated.DeprecationInfo.as_dict].
+
+        Parameters:
+            data: The serialized data.
+
+        Returns:
+            The deprecation data.
+        """
+        info = cls(data.get("message"), data.get("since"), data.get("alternatives", ()), category=data.get("category"))
+        if data.get("params"):
+            info.update({"params": data["params"]})
+        return info
+
+    def update(self, data: dict[str, Any]) -> None:
+        """Merge the data returned by a decorator parser.
+
+        Parameters:
+            data: The deprecation data, see [`parsers`][griffe_warnings_deprecated.parsers].
+        """
+        if "message" in data:
+            self.message = data["message"]
+        if "since" in data:
+            self.since = _intern(data["since"])
+        if "alternatives" in data:
+            self.alternatives = tuple(map(sys.intern, data["alternatives"] or ()))
+        if "params" in data:
+            params = dict(self.params)
+            params.update(
+                {name: (_intern(since), _intern(alternative)) for name, (since, alternative) in data["params"].items()},
+            )
+            self.params = params
+
+    def as_dict(self, **kwargs: Any) -> dict[str, Any]:  # noqa: ARG002
+        """Serialize the deprecation data, omitting empty fields.
+
+        Parameters:
+            **kwargs: Ignored, accepted for compatibility with Griffe's JSON encoder.
+
+        Returns:
+            A JSON-serializable dictionary.
+        """
+        data = {
+            "message": self.message,
+            "since": self.since,
+            "alternatives": list(self.alternatives),
+            "params": dict(self.params),
+            "category": self.category,
+        }
+        return {key: value for key, value in data.items() if value or value == ""}
+
+    @property
+    def message_only(self) -> bool:
+        """Whether the data is a non-empty message only, which is then also the rendered text."""
+        return bool(self.message) and self.since is None and not (self.alternatives or self.params or self.category)
+
+    @property
+    def deprecates_object(self) -> bool:
+        """Whether the object itself is deprecated (not just some of its parameters)."""
+        return self.message is not None or self.since is not None
+
+    def render(self, obj: Class | Function | Attribute) -> str:
+        """Render the deprecation text of the object.
+
+        Parameters:
+            obj: The deprecated object.
+
+        Returns:
+            The deprecation text, never empty: bare decorators get a default text.
+        """
+        if self.since is None:
+            return self.message or f"`{obj.name}` is deprecated."
+        text = f"`{obj.name}` is deprecated since {self.since} and may be removed in future versions."
+        if self.message is not None:
+            text += f"\n\n{self.message}"
+        if self.alternatives:
+            obj_anchestry = _object_anchestry(obj)
+            alternatives = [f"[`{_remove_common_anchestors(a, obj_anchestry)}`][{a}]" for a in self.alternatives]
+            text += f"\n\n**Alternative{'s' if len(alternatives) > 1 else ''}**: {', '.join(alternatives)}"
+        return text
+
+def deprecation_info(obj: Object) -> DeprecationInfo | None:
+    """Return the deprecation data stored on an object by the extension.
+
+    Parameters:
+        obj: A Griffe object.
+
+    Returns:
+        The deprecation data, or `None` if the object (or its parameters) isn't deprecated.
+    """
+    deprecation = obj.extra.get(self_namespace, {}).get("deprecation")
+    if deprecation is None and isinstance(obj.deprecated, str):
+        # Objects only deprecated with a message don't store their data, see `DeprecationInfo`.
+        return DeprecationInfo(message=obj.deprecated)
+    return deprecation
+
+def _literal(expr: str | Expr) -> Any:
+    # Evaluate the constant expressions found in decorator arguments without
+    # going back to source text, falling back to `literal_eval` for other shapes.
+    if isinstance(expr, str):
+        quote = expr[:1]
+        if (
+            quote in {"'", '"'}
+            and len(expr) > 1
+            and expr[-1] == quote
+            and quote not in (inner := expr[1:-1])
+            and "\\" not in inner
+        ):
+            return inner
+        return ast.literal_eval(expr)
+    if isinstance(expr, ExprList):
+        return [_literal(e) for e in expr.elements]
+    if isinstance(expr, ExprDict) and None not in expr.keys:  # `None` keys are `**spread` entries.
+        return dict(zip(map(_literal, expr.keys), map(_literal, expr.values)))  # type: ignore[arg-type]
+    if isinstance(expr, ExprCall) and isinstance(expr.function, ExprName) and expr.function.name == "dict":
+        return {e.name: _literal(e.value) for e in expr.arguments if isinstance(e, ExprKeyword)}
+    return ast.literal_eval(str(expr))
+
+def _is_pattern(path: str) -> bool:
+    return any(char in path for char in "*?[")
+
+def _last_name(expr: str | Expr) -> str:
+    if isinstance(expr, ExprName):
+        return expr.name
+    if isinstance(expr, ExprAttribute):
+        return expr.last.name
+    return str(expr).rsplit(".", 1)[-1]
+
+class _PathCache:
+    """Cache of resolved decorator paths, keyed by the textual head of decorators.
+
+    The cache is meant to be cleared after each module:
+    within a module, the same decorator text resolves to the same path
+    (unless a class body shadows an imported name, which we don't support).
+    """
+
+    def __init__(self, stats: ExtensionStats | None = None) -> None:
+        self.paths: dict[str, str] = {}
+        """Resolved paths of the decorators seen in the current module."""
+        self.stats = stats
+        """Statistics in which hits and misses are counted, if collected."""
+
+    def callable_path(self, decorator: Decorator) -> str:
+        """Return the resolved path of a decorator.
+
+        Parameters:
+            decorator: A decorator.
+
+        Returns:
+            The path of the decorator, or of the called decorator.
+        """
+        value = decorator.value
+        function = value.function if isinstance(value, ExprCall) else value
+        key = function.name if isinstance(function, ExprName) else str(function)
+        try:
+            path = self.paths[key]
+        except KeyError:
+            if self.stats:
+                self.stats.path_resolutions += 1
+            path = self.paths[key] = decorator.callable_path
+        else:
+            if self.stats:
+                self.stats.path_cache_hits += 1
+        return path
+
+    def clear(self) -> None:
+        """Forget the cached paths."""
+        self.paths.clear()
+
+class _AdmonitionCache:
+    """Flyweight cache of admonition sections, keyed by kind, title and text.
+
+    Overloads, inherited members and cascaded members often get byte-identical admonitions:
+    they share a single section object, which must therefore be treated as immutable.
+    The cache is meant to be cleared after each package is loaded.
+    """
+
+    def __init__(self, stats: ExtensionStats | None = None) -> None:
+        self.sections: dict[tuple[str, str | None, str], DocstringSectionAdmonition] = {}
+        """Admonition sections handed out since the cache was last cleared."""
+        self.stats = stats
+        """Statistics in which shared sections are counted, if collected."""
+
+    def section(self, kind: str, title: str | None, text: str) -> DocstringSectionAdmonition:
+        """Return the admonition section with the given kind, title and text.
+
+        Parameters:
+            kind: The admonition kind.
+            title: The admonition title.
+            text: The admonition text.
+
+        Returns:
+            A shared section.
+        """
+        key = (kind, title, text)
+        try:
+            section = self.sections[key]
+        except KeyError:
+            section = self.sections[key] = DocstringSectionAdmonition(kind=kind, text=text, title=title)
+        else:
+            if self.stats:
+                self.stats.admonitions_shared += 1
+        return section
+
+    def prepend(self, kind: str, title: str | None, text: str, sections: list[DocstringSection]) -> None:
+        """Insert the shared admonition section at the start of docstring sections.
+
+        The section is only looked up when the edit is applied, so deferred edits only hold its strings.
+
+        Parameters:
+            kind: The admonition kind.
+            title: The admonition title.
+            text: The admonition text.
+            sections: The docstring sections.
+        """
+        sections.insert(0, self.section(kind, title, text))
+
+    def clear(self) -> None:
+        """Forget the shared sections."""
+        self.sections.clear()
+
+class _AdmonitionEdit:
+    """Insertion of a shared admonition section, applied now or when the docstring is parsed.
+
+    Deferred edits are kept for each deprecated object until its docstring is parsed:
+    a single slotted object holding the strings is smaller than a `partial` of a bound method.
+    """
+
+    __slots__ = ("cache", "kind", "text", "title")
+
+    def __init__(self, cache: _AdmonitionCache, kind: str, title: str | None, text: str) -> None:
+        self.cache = cache
+        self.kind = kind
+        self.title = title
+        self.text = text
+
+    def __call__(self, sections: list[DocstringSection]) -> None:
+        self.cache.prepend(self.kind, self.title, self.text, sections)
+
+class _DecoratorMatcher:
+    """Match decorator paths against exact paths and glob patterns, compiled once."""
+
+    def __init__(self, paths: Iterable[str]) -> None:
+        paths = set(paths)
+        self.paths = frozenset(path for path in paths if not _is_pattern(path))
+        """Exact decorator paths."""
+        patterns = sorted(paths - self.paths)
+        self.regex = re.compile("|".join(map(fnmatch.translate, patterns))) if patterns else None
+        """Compiled glob patterns, if any."""
+        last_names = {path.rsplit(".", 1)[-1] for path in paths}
+        self.names = None if any(map(_is_pattern, last_names)) else frozenset(last_names)
+        """Last name segments of the decorators, or `None` when they are not known in advance."""
+        self.prefixes = frozenset(path.rsplit(".", i)[0] for path in self.paths for i in range(1, path.count(".") + 1))
+        """Parent paths of the exact decorator paths."""
+        self._pattern_tails = tuple({pattern.rsplit(".", 1)[-1] for pattern in patterns})
+        # Literal leading segments of the patterns with wildcards before their last segment:
+        # the decorator can be reached through any import along these segments, e.g. `import mylib` for `mylib.*.old_*`.
+        self._pattern_heads = tuple(
+            {".".join(_literal_head(pattern)) for pattern in patterns if _is_pattern(pattern.rsplit(".", 1)[0])},
+        )
+
+    def match(self, path: str) -> bool:
+        """Tell whether a resolved path is the path of a deprecation decorator.
+
+        Parameters:
+            path: The resolved decorator path.
+
+        Returns:
+            Whether it matches.
+        """
+        return path in self.paths or (self.regex is not None and self.regex.match(path) is not None)
+
+    def decorator_path(
+        self,
+        decorator: Decorator,
+        names: frozenset[str] = frozenset(),
+        cache: _PathCache | None = None,
+    ) -> str | None:
+        """Return the path of a deprecation decorator.
+
+        The last name segment of the decorator is checked first,
+        so that most decorators are rejected without resolving their path.
+
+        Parameters:
+            decorator: The decorator, called or not.
+            names: Additional names bound to deprecation decorators (import aliases).
+            cache: Cache of resolved decorator paths.
+
+        Returns:
+            The resolved path, or `None` if the decorator is not a deprecation decorator.
+        """
+        value = decorator.value
+        function = value.function if isinstance(value, ExprCall) else value
+        if not isinstance(function, (ExprName, ExprAttribute)):
+            return None
+        if self.names is not None:
+            name = _last_name(function)
+            if name not in self.names and name not in names:
+                return None
+        path = cache.callable_path(decorator) if cache else decorator.callable_path
+        return path if self.match(path) else None
+
+    def may_import(self, path: str) -> bool:
+        """Tell whether an imported path can give access to a deprecation decorator.
+
+        Parameters:
+            path: The imported path.
+
+        Returns:
+            Whether the decorator can be accessed through this import.
+        """
+        if path in self.paths or path in self.prefixes:
+            return True
+        if self.regex is None:
+            return False
+        if any(_is_segment_prefix(path, head) or _is_segment_prefix(head, path) for head in self._pattern_heads):
+            return True
+        return any(self.regex.match(f"{path}.{tail}" if tail else path) for tail in ("", *self._pattern_tails))
+
+def _literal_head(pattern: str) -> list[str]:
+    # Leading segments of a glob pattern that contain no wildcard.
+    head = []
+    for segment in pattern.split("."):
+        if _is_pattern(segment):
+            break
+        head.append(segment)
+    return head
+
+def _is_segment_prefix(prefix: str, path: str) -> bool:
+    return not prefix or path == prefix or path.startswith(f"{prefix}.")
+
+def _evaluate(arguments: Sequence[str | Expr]) -> tuple[list[Any], dict[str, Any]]:
+    # Statically evaluate decorator arguments: positional arguments that are not literals are `None`,
+    # keyword arguments that are not literals are omitted. Names are rejected without an evaluation attempt.
+    args: list[Any] = []
+    kwargs: dict[str, Any] = {}
+    for argument in arguments:
+        keyword = isinstance(argument, ExprKeyword)
+        expr = argument.value if keyword else argument  # type: ignore[union-attr]
+        if isinstance(expr, (ExprName, ExprAttribute)) and str(expr) not in {"True", "False", "None"}:
+            value, ok = None, False
+        else:
             try:
-                match arg.name:
-                    case "since":
-                        since = ast.literal_eval(arg.value)
-                    case "params":
-                        if isinstance(arg, ExprKeyword):
-                            params = [ast.literal_eval(e) for e in arg.value.elements]
-                    case "alternatives": # ExprCall | ExprDict
-                        if isinstance(arg.value, ExprCall) and arg.value.function.name == "dict":
-                            alternatives = {e.name: ast.literal_eval(e.value)
-                                            for e in arg.value.arguments if isinstance(e, ExprKeyword)}
-                        elif isinstance(arg.value, ExprDict):
-                            alternatives = dict(zip(map(ast.literal_eval, arg.value.keys),
-                                                    map(ast.literal_eval, arg.value.values)))
-            except ValueError:
-                pass
-        if since is None:
+                value, ok = _literal(expr), True
+            except (ValueError, SyntaxError, TypeError, RecursionError, MemoryError):
+                # Valid code that isn't a usable literal, e.g. unhashable dictionary keys or deep nesting.
+                value, ok = None, False
+        if keyword:
+            if ok:
+                kwargs[argument.name] = value  # type: ignore[union-attr]
+        else:
+            if not ok:
+                logger.debug(f"{expr} is not a static string")
+            args.append(value)
+    return args, kwargs
+
+def _parser_name(parser: DecoratorParser) -> str:
+    # Parsers are part of the cache key, callables without a qualified name (e.g. partials) fall back to their repr.
+    qualname = getattr(parser, "__qualname__", None)
+    return f"{getattr(parser, '__module__', None)}.{qualname}" if qualname else repr(parser)
+
+def _scan_decorators(
+    obj: Class | Function | Attribute,
+    matcher: _DecoratorMatcher,
+    names: frozenset[str] = frozenset(),
+    *,
+    cache: _PathCache | None = None,
+    stats: ExtensionStats | None = None,
+    parsers: dict[str, DecoratorParser] = BUILTIN_PARSERS,
+    decorators: Iterable[Decorator] | None = None,
+) -> DeprecationInfo | None:
+    # Walk the decorators once, resolving each decorator path at most once,
+    # and dispatch their arguments to the parser registered for their path.
+    deprecation = None
+    for decorator in obj.decorators if decorators is None else decorators:  # type: ignore[union-attr]
+        if stats:
+            stats.decorators_examined += 1
+        path = matcher.decorator_path(decorator, names, cache)
+        if path is None:
+            continue
+        arguments = decorator.value.arguments if isinstance(decorator.value, ExprCall) else ()
+        if stats:
+            stats.literal_evaluations += len(arguments)
+        data = parsers.get(path, parse_keywords)(*_evaluate(arguments))
+        if data is None:
             logger.debug(f"No static string or 'since=<string>' keyword found for '{obj.name}'")
-            return dict()
-    return {p: _deprecate_param(since, alternatives.get(p)) for p in params}
-
-def _deprecated_braian(obj: Class | Function, kwargs: Sequence[Expr]) -> str | None:
-    message = None
-    since = None
-    alternatives = None
-    for arg in kwargs:
-        if not isinstance(arg, ExprKeyword):
             continue
-        try:
-            match arg.name:
-                case "message":
-                    message =  ast.literal_eval(arg.value)
-                case "since":
-                    since = ast.literal_eval(arg.value)
-                case "alternatives": # ExprList
-                    alternatives = [ast.literal_eval(e) for e in arg.value.elements]
-        except ValueError:
-            pass
-    if since is None:
-        logger.debug(f"No static string or 'since=<string>' keyword found for '{obj.name}'")
+        deprecation = deprecation or DeprecationInfo()
+        deprecation.update(data)
+        for argument in arguments:
+            if isinstance(argument, ExprKeyword) and argument.name == "category":
+                deprecation.category = _intern(str(argument.value))
+    return deprecation
+
+def _attribute_decorators(attr: Attribute, node: ast.AST | ObjectNode | None) -> list[Decorator]:
+    # Griffe turns properties into attributes without decorators: rebuild them from the function node.
+    # Attributes assigned a decorated object, `name = deprecated("message")(target)`, get the called decorator.
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return [
+            Decorator(value, lineno=decorator.lineno, endlineno=decorator.end_lineno)
+            for decorator in node.decorator_list
+            if (value := safe_get_expression(decorator, parent=attr.parent, parse_strings=False)) is not None  # type: ignore[arg-type]
+        ]
+    if isinstance(attr.value, ExprCall) and isinstance(attr.value.function, ExprCall):
+        return [Decorator(attr.value.function, lineno=attr.lineno, endlineno=attr.endlineno)]
+    return []
+
+def _imported_names(node: ast.Module, mod: Module) -> Iterator[tuple[str, str]]:
+    # Yield the names bound by import statements and their full paths, looking into compound
+    # statements (`if TYPE_CHECKING:`, `try:`, class bodies) but not into function bodies.
+    package = mod.path.split(".") if mod.is_init_module else mod.path.split(".")[:-1]
+    statements = list(node.body)
+    while statements:
+        stmt = statements.pop()
+        if isinstance(stmt, ast.Import):
+            for alias in stmt.names:
+                yield alias.asname or alias.name.split(".", 1)[0], alias.name
+        elif isinstance(stmt, ast.ImportFrom):
+            if stmt.level:
+                base = package[: len(package) - stmt.level + 1]
+                module = ".".join([*base, stmt.module] if stmt.module else base)
+            else:
+                module = stmt.module or ""
+            for alias in stmt.names:
+                yield alias.asname or alias.name, f"{module}.{alias.name}"
+        elif not isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            for field_name in ("body", "orelse", "finalbody", "handlers"):
+                statements.extend(getattr(stmt, field_name, ()))
+
+def _decorator_names(imports: list[tuple[str, str]], mod: Module, matcher: _DecoratorMatcher) -> frozenset[str] | None:
+    # Return the local names that may refer to deprecation decorators in a module,
+    # or `None` if the module cannot use any deprecation decorator.
+    names = {name for name, path in imports if matcher.may_import(path)}
+    if not names and not matcher.may_import(mod.path):
         return None
-    text = f"`{obj.name}` is deprecated since {since} and may be removed in future versions."
-    if message is not None:
-        text += f"\n\n{message}"
-    if alternatives:
-        obj_anchestry = _object_anchestry(obj)
-        alternatives = [f"[`{_remove_common_anchestors(a, obj_anchestry)}`][{a}]" for a in alternatives]
-        text += f"\n\n**Alternative{'s' if len(alternatives) > 1 else ''}**: {', '.join(alternatives)}"
-    return text
-
-def _deprecated(obj: Class | Function) -> str | None:
-    for decorator in obj.decorators:
-        if decorator.callable_path in _decorators and isinstance(decorator.value, ExprCall):
-            first_arg = decorator.value.arguments[0]
+    return frozenset(names)
+
+def _warn_names(imports: list[tuple[str, str]]) -> tuple[frozenset[str], frozenset[str]] | None:
+    # Return the local names bound to `warnings.warn` and to the `warnings` module,
+    # or `None` if the module cannot call `warnings.warn`.
+    functions = frozenset(name for name, path in imports if path == "warnings.warn")
+    modules = frozenset(name for name, path in imports if path == "warnings")
+    return (functions, modules) if functions or modules else None
+
+def _runtime_deprecations(module: object, path: str, stats: ExtensionStats | None = None) -> dict[str, str]:
+    # Read the PEP 702 `__deprecated__` attributes of the objects of a runtime module in one pass
+    # over its namespace and the namespaces of its classes, rather than one lookup per inspected object.
+    # Only own namespaces are read: subclasses of deprecated classes inherit the attribute but aren't deprecated.
+    deprecations: dict[str, str] = {}
+    module_name = getattr(module, "__name__", None)
+    namespaces: list[tuple[str, Mapping[str, Any]]] = [(path, getattr(module, "__dict__", {}))]
+    seen: set[int] = set()
+    while namespaces:
+        prefix, namespace = namespaces.pop()
+        for name, value in list(namespace.items()):
+            # Proxies and other dynamic objects can raise anything when their attributes are accessed:
+            # such members are skipped, they must never make the module fail to load.
             try:
-                return ast.literal_eval(first_arg)  # type: ignore[arg-type]
-            except (ValueError, IndexError):
-                pass
-            return _deprecated_braian(obj, decorator.value)
+                if isinstance(value, (staticmethod, classmethod)):
+                    value = value.__func__  # noqa: PLW2901
+                elif isinstance(value, property):
+                    value = value.fget  # noqa: PLW2901
+                elif isinstance(value, cached_property):
+                    value = value.func  # noqa: PLW2901
+                own = getattr(value, "__dict__", None)
+                if not isinstance(own, Mapping):
+                    continue
+                message = own.get("__deprecated__")
+                message = None if message is None else str(message)
+            except Exception:  # noqa: BLE001
+                logger.debug(f"Could not read the `__deprecated__` attribute of {prefix}.{name}")
+                continue
+            if stats:
+                stats.runtime_lookups += 1
+            member_path = f"{prefix}.{name}"
+            if message is not None:
+                deprecations[member_path] = message
+            if isinstance(value, type) and id(value) not in seen and own.get("__module__") == module_name:
+                seen.add(id(value))
+                namespaces.append((member_path, own))
+    return deprecations
+
+def _message(node: ast.expr) -> str:
+    # Static text of a warning message: f-strings keep their replacement fields as source.
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.JoinedStr):
+        parts = []
+        for value in node.values:
+            if isinstance(value, ast.FormattedValue):
+                parts.append(f"{{{ast.unparse(value.value)}}}")
+            elif isinstance(value, ast.Constant):
+                parts.append(str(value.value))
+        return "".join(parts)
+    return ""
+
+def _scan_warn_calls(
+    func: Function | Attribute,
+    node: ast.FunctionDef | ast.AsyncFunctionDef,
+    names: tuple[frozenset[str], frozenset[str]],
+    statements: int,
+    stats: ExtensionStats | None = None,
+) -> DeprecationInfo | None:
+    # Look for `warnings.warn(message, DeprecationWarning)` in the first statements of a function.
+    # The source lines are checked first, so that most function bodies are never walked.
+    lines = func.lines
+    if not any("Warning" in line for line in lines) or not any("warn" in line for line in lines):
+        return None
+    if stats:
+        stats.bodies_examined += 1
+    functions, modules = names
+    body = node.body
+    if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant):
+        body = body[1:]  # Docstring.
+    for stmt in body[:statements]:
+        if not isinstance(stmt, ast.Expr) or not isinstance(call := stmt.value, ast.Call):
+            continue
+        callee = call.func
+        if not (
+            (isinstance(callee, ast.Name) and callee.id in functions)
+            or (
+                isinstance(callee, ast.Attribute)
+                and callee.attr == "warn"
+                and isinstance(callee.value, ast.Name)
+                and callee.value.id in modules
+            )
+        ):
+            continue
+        keywords = {keyword.arg: keyword.value for keyword in call.keywords}
+        category = call.args[1] if len(call.args) > 1 else keywords.get("category")
+        if isinstance(category, ast.Attribute):
+            category_name = category.attr
+        elif isinstance(category, ast.Name):
+            category_name = category.id
+        else:
+            continue
+        if category_name in _warning_categories:
+            message = call.args[0] if call.args else keywords.get("message")
+            return DeprecationInfo(message=_message(message) if message is not None else "", category=category_name)
     return None
 
+class _DeferredDocstring(Docstring):
+    # Docstring whose deprecation edits are only applied when its sections are first parsed.
+    _deprecation_edits: tuple[Callable[[list[DocstringSection]], None], ...]
+
+    @cached_property
+    def parsed(self) -> list[DocstringSection]:
+        sections = self.parse()
+        for edit in self._deprecation_edits:
+            edit(sections)
+        return sections
+
+def _edit_sections(docstring: Docstring, edit: Callable[[list[DocstringSection]], None], *, lazy: bool) -> bool:
+    # Edit the docstring sections, now or when they are first parsed.
+    # Return whether the docstring had to be parsed.
+    parsed = "parsed" in docstring.__dict__
+    if not lazy or parsed:
+        # Sections were already parsed (or we were asked not to wait): edit them right away.
+        edit(docstring.parsed)
+        return not parsed
+    if not isinstance(docstring, _DeferredDocstring):
+        docstring.__class__ = _DeferredDocstring
+        docstring._deprecation_edits = ()  # type: ignore[attr-defined]
+    # A tuple rather than a list: most docstrings get a single edit.
+    docstring._deprecation_edits += (edit,)  # type: ignore[attr-defined]
+    return False
+
+def _annotate_params(sections: list[DocstringSection], messages: dict[str, str]) -> bool:
+    # Index documented parameters by name once, then prepend each message to its parameter.
+    # Return whether the sections document any parameter.
+    documented: dict[str, DocstringParameter] = {}
+    for section in sections:
+        if isinstance(section, (DocstringSectionParameters, DocstringSectionOtherParameters)):
+            for param in section.value:
+                documented.setdefault(param.name.lstrip("*"), param)
+    for name, message in messages.items():
+        if target := documented.get(name):
+            target.description = message + target.description
+    return bool(documented)
+
+def _parameters_section(fun: Function, messages: dict[str, str]) -> DocstringSectionParameters:
+    # Build the parameters section of a function that documents none, directly from its signature.
+    parameters = list(fun.parameters)
+    if parameters and fun.parent and fun.parent.is_class and not fun.has_labels("staticmethod"):
+        parameters = parameters[1:]  # Skip `self` or `cls`.
+    return DocstringSectionParameters(
+        [
+            DocstringParameter(
+                param.name,
+                description=messages.get(param.name, "").rstrip(),
+                annotation=param.annotation,
+                value=param.default,
+            )
+            for param in parameters
+        ],
+    )
+
+def _package_classes(pkg: Module) -> Iterator[Class]:
+    # Yield the classes defined in a package (not imported ones), nested classes included.
+    objects: list[Module | Class] = [pkg]
+    while objects:
+        obj = objects.pop()
+        for member in obj.members.values():
+            if not member.is_alias and (member.is_module or member.is_class):
+                objects.append(member)  # type: ignore[arg-type]
+                if member.is_class:
+                    yield member  # type: ignore[misc]
+
+class _Inheritance:
+    """Deprecated ancestors and deprecated methods of classes, computed once per class."""
+
+    def __init__(self) -> None:
+        # Deprecated ancestors, deprecated methods inherited from ancestors,
+        # and deprecated methods visible from the class (own ones included), by class path.
+        self._memo: dict[str, tuple[list[Class], dict[str, Function], dict[str, Function]]] = {}
+
+    def of(self, cls: Class) -> tuple[list[Class], dict[str, Function], dict[str, Function]]:
+        """Return the deprecated ancestors and methods of a class.
+
+        Each base is only computed once, so the whole graph is walked in near-linear time.
+
+        Parameters:
+            cls: The class.
+
+        Returns:
+            The deprecated ancestors, the deprecated methods inherited from ancestors by name,
+            and the deprecated methods visible from the class by name.
+        """
+        if cls.path in self._memo:
+            return self._memo[cls.path]
+        # Guard against inheritance cycles while the class is being computed.
+        self._memo[cls.path] = ([], {}, {})
+        ancestors: list[Class] = []
+        inherited: dict[str, Function] = {}
+        for base in cls.resolved_bases:
+            if not base.is_class:
+                continue
+            base_ancestors, _, base_methods = self.of(base)  # type: ignore[arg-type]
+            for ancestor in (base, *base_ancestors) if base.deprecated else base_ancestors:
+                if ancestor not in ancestors:
+                    ancestors.append(ancestor)  # type: ignore[arg-type]
+            for name, method in base_methods.items():
+                inherited.setdefault(name, method)
+        methods = dict(inherited)
+        for name, member in cls.members.items():
+            if not member.is_alias and member.is_function and member.deprecated:
+                methods[name] = member  # type: ignore[assignment]
+        self._memo[cls.path] = result = (ancestors, inherited, methods)
+        return result
+
+def _module_marker(mod: Module) -> str | None:
+    # Message of a module-level `__deprecated__ = "message"` assignment.
+    member = mod.members.get("__deprecated__")
+    if member is None or member.is_alias or not member.is_attribute or member.value is None:  # type: ignore[union-attr]
+        return None
+    try:
+        message = _literal(member.value)  # type: ignore[union-attr]
+    except (ValueError, SyntaxError):
+        return None
+    return message if isinstance(message, str) else None
+
+def _is_overload(func: Function) -> bool:
+    # Overloads are collected in their parent's `overloads` until the implementation is visited,
+    # and are never members: the implementation takes their place.
+    overloads = getattr(func.parent, "overloads", None)
+    return isinstance(overloads, dict) and any(overload is func for overload in overloads.get(func.name, ()))
+
+def _is_member(obj: Object) -> bool:
+    # Overloads never become members, even once their implementation is visited.
+    return obj.parent is None or obj.parent.members.get(obj.name) is obj
+
+def _record_key(obj: Class | Function | Attribute, *, overload: bool = False) -> str:
+    # Overloads share the path of their implementation, their line number tells them apart.
+    return f"{obj.path}@{obj.lineno}" if overload else obj.path
+
+_star_kinds = frozenset({ParameterKind.keyword_only, ParameterKind.var_positional})
+_variadic_kinds = frozenset({ParameterKind.var_positional, ParameterKind.var_keyword})
+
+def _signature(func: Function) -> str:
+    # Render a function signature on one line, without the `self` or `cls` parameter of methods.
+    params = list(func.parameters)
+    if params and func.parent and func.parent.is_class and "staticmethod" not in func.labels:
+        params = params[1:]
+    parts = []
+    previous = None
+    for param in params:
+        if previous is ParameterKind.positional_only and param.kind is not ParameterKind.positional_only:
+            parts.append("/")
+        if param.kind is ParameterKind.keyword_only and previous not in _star_kinds:
+            parts.append("*")
+        text = {ParameterKind.var_positional: "*", ParameterKind.var_keyword: "**"}.get(param.kind, "") + param.name
+        if param.annotation is not None:
+            text += f": {param.annotation}"
+        if param.default is not None and param.kind not in _variadic_kinds:
+            text += f" = {param.default}" if param.annotation is not None else f"={param.default}"
+        parts.append(text)
+        previous = param.kind
+    if previous is ParameterKind.positional_only:
+        parts.append("/")
+    returns = f" -> {func.returns}" if func.returns is not None else ""
+    return f"{func.name}({', '.join(parts)}){returns}"
+
+def _overloads_message(overloads: list[tuple[Function, str]]) -> str:
+    # List the deprecated signatures of an overloaded function, with their indented deprecation texts.
+    items = []
+    for overload, text in overloads:
+        item = f"- `{_signature(overload)}`"
+        if text:
+            item += ": " + "\n".join(f"    {line}" if line else line for line in text.split("\n")).lstrip()
+        items.append(item)
+    plural = "s are" if len(overloads) > 1 else " is"
+    return f"The following signature{plural} deprecated:\n\n" + "\n".join(items)
+
+def _link(obj: Object) -> str:
+    name = f"{obj.parent.name}.{obj.name}" if obj.is_function and obj.parent else obj.name
+    return f"[`{name}`][{obj.path}]"
+
+_timed_hooks = (
+    "on_module_instance",
+    "on_module_members",
+    "on_class_instance",
+    "on_function_instance",
+    "on_attribute_instance",
+    "on_package_loaded",
+    "on_package",
+)
+
 class WarningsDeprecatedExtension(Extension):
     """Griffe extension for `@warnings.deprecated` (PEP 702)."""
 
@@ -112,6 +840,20 @@ class WarningsDeprecatedExtension(Extension):
         kind: str = "deprecated",
         title: str | None = "Deprecated",
         label: str | None = "deprecated",
+        *,
+        lazy: bool = False,
+        decorators: Sequence[str] | None = None,
+        cache_dir: str | None = None,
+        inventory: str | None = None,
+        stats: bool = False,
+        removal_policy: dict[str, Any] | None = None,
+        warn_calls: int = 0,
+        inherited: bool = False,
+        cascade: bool = False,
+        cascade_label: str | None = "deprecated-parent",
+        cascade_admonition: bool = False,
+        deprecated_modules: dict[str, str] | None = None,
+        parsers: dict[str, str | DecoratorParser] | None = None,
     ) -> None:
         """Initialize the extension.
 
@@ -119,52 +861,321 @@ class WarningsDeprecatedExtension(Extension):
             kind: Admonitions kind.
             title: Admonitions title.
             label: Label added to deprecated objects.
+            lazy: Defer docstring edits until the docstring sections are first accessed.
+                Docstrings that are never rendered are then never parsed.
+            decorators: Paths of the deprecation decorators to look for, replacing the default ones
+                (the decorators that have a parser). Glob patterns such as `*.deprecated` are supported.
+            cache_dir: Directory in which to cache the deprecations found in each module.
+                Unchanged modules are then not scanned again when reloaded (e.g. with `mkdocs serve`).
+            inventory: File in which to write the list of deprecated objects, once per package.
+                A `{package}` placeholder is replaced by the package name.
+                Files with a `.jsonl` suffix get one JSON record per line, other files get a JSON array.
+            stats: Collect counters and time the extension hooks.
+                Statistics are logged at the debug level when packages are loaded.
+            removal_policy: Options of a [`RemovalPolicy`][griffe_warnings_deprecated.policy.RemovalPolicy]
+                (`current_version`, `after`, `part`). Objects whose removal version is reached
+                are reported as warnings when packages are loaded.
+            warn_calls: Number of leading statements of function bodies in which to look for
+                `warnings.warn(message, DeprecationWarning)` calls (`PendingDeprecationWarning`
+                and `FutureWarning` are supported too). Disabled with 0.
+            inherited: Add an admonition to the subclasses of deprecated classes,
+                and to the methods overriding deprecated methods, when packages are loaded.
+            cascade: Mark the members of deprecated classes and modules, recursively, when packages are loaded.
+            cascade_label: Label added to members of deprecated classes and modules.
+            cascade_admonition: Also add an admonition to members of deprecated classes and modules.
+            deprecated_modules: Deprecated modules, mapped to their deprecation message.
+                Modules can also be deprecated with a module-level `__deprecated__ = "message"` assignment.
+            parsers: Parsers of decorator arguments (or their `module:function` import paths), by decorator path.
+                They complement the built-in parsers and the ones registered with entry points,
+                see [`parsers`][griffe_warnings_deprecated.parsers].
         """
         super().__init__()
         self.kind = kind
         self.title = title or ""
         self.label = label
+        self.lazy = lazy
+        self.parsers: dict[str, DecoratorParser] = {
+            **BUILTIN_PARSERS,
+            **entry_point_parsers(),
+            **{path: load_parser(parser) for path, parser in (parsers or {}).items()},
+        }
+        """Parsers of decorator arguments, by decorator path."""
+        self.decorators = sorted(set(self.parsers if decorators is None else decorators) | (parsers or {}).keys())
+        self._matcher = _DecoratorMatcher(self.decorators)
+        self.stats = ExtensionStats()
+        """Statistics collected by the extension, see [`ExtensionStats`][griffe_warnings_deprecated.ExtensionStats]."""
+        # Names that may refer to deprecation decorators in the current module, `None` to skip the module.
+        self._module_names: frozenset[str] | None = frozenset()
+        # Counters are only collected with `stats`, each of them then costs a `None` check.
+        self._stats = self.stats if stats else None
+        self._path_cache = _PathCache(self._stats)
+        self._admonitions = _AdmonitionCache(self._stats)
+        self.warn_calls = warn_calls
+        self.inherited = inherited
+        self.cascade = cascade
+        self.cascade_label = cascade_label
+        self.cascade_admonition = cascade_admonition
+        self.deprecated_modules = deprecated_modules or {}
+        # Names bound to `warnings.warn` and to `warnings` in the current module, `None` to skip the module.
+        self._warn_names: tuple[frozenset[str], frozenset[str]] | None = None
+        # `__deprecated__` messages of the objects of the current module, by path, if it is inspected.
+        self._runtime_messages: dict[str, str] | None = None
+        self.cache = (
+            DeprecationCache(
+                cache_dir,
+                self.decorators,
+                {path: _parser_name(parser) for path, parser in self.parsers.items()},
+                warn_calls,
+            )
+            if cache_dir
+            else None
+        )
+        """On-disk cache of deprecations, if enabled."""
+        # Records of the current module, read from the cache, or collected to be written to it.
+        self._cached_records: dict[str, DeprecationInfo] | None = None
+        self._new_records: dict[str, dict[str, Any]] | None = None
+        self._cache_key = ""
+        self.inventory = inventory
+        # Deprecated objects collected for the inventory, records are only built when requested.
+        # Their deprecation data is stored in their `extra` attribute, see `deprecation_info`.
+        self._deprecated_objects: list[Object] = []
+        self._package_objects: dict[str, list[Object]] = {}
+        self.removal_policy = RemovalPolicy(**removal_policy) if removal_policy else None
+        """Removal policy, if enabled."""
+        if stats:
+            for hook in _timed_hooks:
+                setattr(self, hook, self.stats.timed(hook, getattr(self, hook)))
 
-    def _insert_message(self, obj: Function | Class, message: str) -> None:
+    def _insert_message(self, obj: Function | Class | Attribute, message: str) -> None:
         title = self.title
         if not self.title:
             title, message = message, title
         if not obj.docstring:
             obj.docstring = Docstring("", parent=obj)
-        sections = obj.docstring.parsed
-        sections.insert(0, DocstringSectionAdmonition(kind=self.kind, text=message, title=title))
+        parsed = _edit_sections(obj.docstring, _AdmonitionEdit(self._admonitions, self.kind, title, message), lazy=self.lazy)
+        if self._stats:
+            self._stats.docstring_parses += parsed
+            self._stats.admonitions_inserted += 1
 
-    def _insert_message_on_param(self, fun: Function, param: Parameter, message: str) -> None:
+    def _insert_messages_on_params(self, fun: Function, messages: dict[str, str]) -> None:
         if not fun.docstring:
-            # docs = "Parameters\n----------\n"
-            # docs +="    \n".join([p.name for p in fun.parameters])
-            # if fun.returns:
-            #     docs+"\nReturns\n-------\n    :\n"
-            # fun.docstring = Docstring(docs, parent=fun)
-            return # didn't manage to add default docstring for functions with params
-        sections = fun.docstring.parsed
-        for section in sections:
-            if isinstance(section, DocstringSectionParameters):
-                for p in section.value: # DocstringParameter
-                    if p.name == param.name:
-                        p.description = message+p.description
+            fun.docstring = Docstring("", parent=fun)
+
+        def edit(sections: list[DocstringSection]) -> None:
+            if not _annotate_params(sections, messages):
+                sections.append(_parameters_section(fun, messages))
+
+        parsed = _edit_sections(fun.docstring, edit, lazy=self.lazy)
+        if self._stats:
+            self._stats.docstring_parses += parsed
+            self._stats.parameters_annotated += len(messages)
+
+    def on_module_instance(self, *, node: ast.AST | ObjectNode, mod: Module, agent: Visitor | Inspector, **kwargs: Any) -> None:  # noqa: ARG002
+        """Prepare the per-module state: cached records, decorator names, or `__deprecated__` messages."""
+        if self._stats:
+            self._stats.modules_visited += 1
+        if isinstance(node, ObjectNode):
+            self._module_names = frozenset()
+            self._runtime_messages = _runtime_deprecations(node.obj, mod.path, self._stats)
+            return
+        if not isinstance(node, ast.Module):
+            self._module_names = frozenset()
+            return
+        if self.cache:
+            self._cache_key = self.cache.key(agent.code)  # type: ignore[union-attr]
+            records = self.cache.load(mod.path, self._cache_key)
+            if records is not None:
+                self._cached_records = {path: DeprecationInfo.from_dict(record) for path, record in records.items()}
+                if self._stats:
+                    self._stats.modules_cached += 1
+                return
+            self._new_records = {}
+        imports = list(_imported_names(node, mod))
+        self._module_names = _decorator_names(imports, mod, self._matcher)
+        self._warn_names = _warn_names(imports) if self.warn_calls else None
+        if self._module_names is None and self._warn_names is None and self._stats:
+            self._stats.modules_skipped += 1
+
+    def on_module_members(self, *, mod: Module, **kwargs: Any) -> None:  # noqa: ARG002
+        """Reset the per-module state once the module has been visited."""
+        if self.cache and self._new_records is not None:
+            self.cache.save(mod.path, self._cache_key, self._new_records)
+        self._module_names = frozenset()
+        self._warn_names = None
+        self._runtime_messages = None
+        self._path_cache.clear()
+        self._cached_records = self._new_records = None
+
+    def _scan(
+        self,
+        obj: Class | Function | Attribute,
+        node: ast.AST | ObjectNode | None = None,
+        *,
+        overload: bool = False,
+    ) -> DeprecationInfo | None:
+        if self._stats:
+            self._stats.objects_visited += 1
+        key = _record_key(obj, overload=overload)
+        if self._cached_records is not None:
+            return self._cached_records.get(key)
+        if self._runtime_messages and obj.path in self._runtime_messages:
+            return DeprecationInfo(message=self._runtime_messages[obj.path])
+        body = self._warn_names is not None and isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+        if self._module_names is None and not body:
+            if self._stats:
+                self._stats.objects_skipped += 1
+            return None
+        deprecation = None
+        if self._module_names is not None:
+            deprecation = _scan_decorators(
+                obj,
+                self._matcher,
+                self._module_names,
+                cache=self._path_cache,
+                stats=self._stats,
+                parsers=self.parsers,
+                decorators=_attribute_decorators(obj, node) if obj.is_attribute else None,  # type: ignore[arg-type]
+            )
+        if deprecation is None and body:
+            names = self._warn_names
+            deprecation = _scan_warn_calls(obj, node, names, self.warn_calls, self._stats)  # type: ignore[arg-type]
+        if deprecation and self._new_records is not None:
+            self._new_records[key] = deprecation.as_dict()
+        return deprecation
 
     def on_class_instance(self, *, cls: Class, **kwargs: Any) -> None:  # noqa: ARG002
         """Add section to docstrings of deprecated classes."""
-        if message := _deprecated(cls):
-            cls.deprecated = message
-            self._insert_message(cls, message)
-            if self.label:
-                cls.labels.add(self.label)
-
-    def on_function_instance(self, *, func: Function, **kwargs: Any) -> None:  # noqa: ARG002
-        """Add section to docstrings of deprecated functions."""
-        if deprecated_params := _braian_deprecate_params(func):
-            for param in func.parameters:
-                if param.name in deprecated_params:
-                    self._insert_message_on_param(func, param, deprecated_params[param.name])
-        elif message := _deprecated(func):
-            func.deprecated = message
-            self._insert_message(func, message)
+        deprecation = self._scan(cls)
+        if deprecation and deprecation.deprecates_object:
+            self._deprecate(cls, deprecation)
+
+    def on_function_instance(self, *, node: ast.AST | ObjectNode, func: Function, **kwargs: Any) -> None:  # noqa: ARG002
+        """Add section to docstrings of deprecated functions, and of functions with deprecated overloads."""
+        if _is_overload(func):
+            self._scan_overload(func, node)
+            return
+        deprecation = self._scan(func, node)
+        if func.overloads and not (deprecation and deprecation.deprecates_object):
+            self._insert_overloads_message(func)
+        if deprecation is None:
+            return
+        if deprecation.params:
+            messages = {
+                param.name: _deprecate_param(*deprecation.params[param.name])
+                for param in func.parameters
+                if param.name in deprecation.params
+            }
+            if messages:
+                self._insert_messages_on_params(func, messages)
+        if deprecation.deprecates_object:
+            self._deprecate(func, deprecation)
+        else:
+            func.extra[self_namespace]["deprecation"] = deprecation
+            self._deprecated_objects.append(func)
+
+    def on_attribute_instance(self, *, node: ast.AST | ObjectNode, attr: Attribute, **kwargs: Any) -> None:  # noqa: ARG002
+        """Add section to docstrings of deprecated properties, and of attributes assigned deprecated objects."""
+        deprecation = self._scan(attr, node)
+        if deprecation and deprecation.deprecates_object:
+            self._deprecate(attr, deprecation)
+
+    def _scan_overload(self, func: Function, node: ast.AST | ObjectNode) -> None:
+        # Overloads have no docstring of their own to edit: they are only marked as deprecated here,
+        # and listed in a single admonition on the implementation, see `_insert_overloads_message`.
+        deprecation = self._scan(func, node, overload=True)
+        if deprecation and deprecation.deprecates_object:
+            func.deprecated = deprecation.render(func)
+            if not deprecation.message_only:
+                func.extra[self_namespace]["deprecation"] = deprecation
+            self._deprecated_objects.append(func)
             if self.label:
-                func.labels.add(self.label)
\ No newline at end of file
+                func.labels.add(self.label)
+
+    def _insert_overloads_message(self, func: Function) -> None:
+        deprecated = [(overload, overload.deprecated) for overload in func.overloads or () if overload.deprecated]
+        if deprecated:
+            self._insert_message(func, _overloads_message(deprecated))  # type: ignore[arg-type]
+
+    def on_package_loaded(self, *, pkg: Module, **kwargs: Any) -> None:  # noqa: ARG002
+        """Propagate deprecations to members and subclasses, write the inventory, report overdue deprecations."""
+        self._mark_tree(pkg)
+        if self._stats and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Deprecations in {pkg.path}: {self._stats.summary()}")
+        objects, self._deprecated_objects = self._deprecated_objects, []
+        self._package_objects[pkg.path] = [obj for obj in objects if obj.package is pkg]
+        self._deprecated_objects = [obj for obj in objects if obj.package is not pkg]
+        if self.inherited:
+            self._propagate_inheritance(pkg)
+        if self.inventory or self.removal_policy:
+            records = self.records(pkg.path)
+            if self.inventory:
+                write_inventory(self.inventory.format(package=pkg.name), records)
+            if self.removal_policy:
+                for item in self.removal_policy.overdue(records):
+                    logger.warning(self.removal_policy.describe(item))
+        # Sections already inserted stay shared, deferred edits fill the cache again when docstrings are parsed.
+        self._admonitions.clear()
+
+    def _mark_tree(self, pkg: Module) -> None:
+        # Deprecate modules and, with `cascade`, mark the members of deprecated objects, in one traversal.
+        # The nearest deprecated parent is passed down the traversal instead of being looked up for each member.
+        stack: list[tuple[Object, Object | None]] = [(pkg, None)]
+        while stack:
+            obj, deprecated_parent = stack.pop()
+            if obj.is_module and not obj.deprecated:
+                message = self.deprecated_modules.get(obj.path) or _module_marker(obj)  # type: ignore[arg-type]
+                if message:
+                    self._deprecate(obj, DeprecationInfo(message=message))  # type: ignore[arg-type]
+            if deprecated_parent is not None and not obj.deprecated:
+                if self.cascade_label:
+                    obj.labels.add(self.cascade_label)
+                if self.cascade_admonition:
+                    kind = deprecated_parent.kind.value
+                    message = f"Member of deprecated {kind} {_link(deprecated_parent)}."
+                    self._insert_message(obj, message)  # type: ignore[arg-type]
+            if self.cascade:
+                deprecated_parent = obj if obj.deprecated else deprecated_parent
+            for member in obj.members.values():
+                if not member.is_alias and (self.cascade or member.is_module):
+                    stack.append((member, deprecated_parent))  # type: ignore[arg-type]
+
+    def _propagate_inheritance(self, pkg: Module) -> None:
+        inheritance = _Inheritance()
+        for cls in _package_classes(pkg):
+            ancestors, inherited, _ = inheritance.of(cls)
+            if ancestors and not cls.deprecated:
+                plural = "es" if len(ancestors) > 1 else ""
+                self._insert_message(cls, f"Inherits from deprecated class{plural} {', '.join(map(_link, ancestors))}.")
+            if not inherited:
+                continue
+            for name, member in cls.members.items():
+                if name in inherited and not member.is_alias and member.is_function and not member.deprecated:
+                    message = f"Overrides deprecated method {_link(inherited[name])}."
+                    self._insert_message(member, message)  # type: ignore[arg-type]
+
+    def records(self, package: str) -> list[dict[str, Any]]:
+        """Return the inventory records of the deprecated objects of a loaded package.
+
+        Parameters:
+            package: The package name.
+
+        Returns:
+            The records, in visiting order.
+        """
+        return [
+            deprecation_record(obj, deprecation_info(obj), path=None if _is_member(obj) else _record_key(obj, overload=True))  # type: ignore[arg-type]
+            for obj in self._package_objects.get(package, ())
+        ]
+
+    # Griffe 2 renamed the `on_package_loaded` event to `on_package`.
+    on_package = on_package_loaded
+
+    def _deprecate(self, obj: Class | Function | Attribute, deprecation: DeprecationInfo) -> None:
+        # The rendered text is shared by the `deprecated` attribute and the admonition.
+        obj.deprecated = message = deprecation.render(obj)
+        if not deprecation.message_only:
+            obj.extra[self_namespace]["deprecation"] = deprecation
+        self._deprecated_objects.append(obj)
+        self._insert_message(obj, message)
+        if self.label:
+            obj.labels.add(self.label)
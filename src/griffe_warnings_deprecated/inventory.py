@@ -0,0 +1,81 @@
+"""Machine-readable inventory of deprecated objects."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from griffe import Object
+
+    from griffe_warnings_deprecated.extension import DeprecationInfo
+
+_BUFFER_SIZE = 1024 * 1024
+
+
+def deprecation_record(obj: Object, deprecation: DeprecationInfo, *, path: str | None = None) -> dict[str, Any]:
+    """Build the inventory record of a deprecated object.
+
+    Parameters:
+        obj: The object, deprecated itself or through some of its parameters.
+        deprecation: Its deprecation data.
+        path: The path of the record, defaults to the path of the object.
+            Overloads share the path of their implementation and are recorded as `path@lineno`.
+
+    Returns:
+        A JSON-serializable record.
+    """
+    try:
+        filepath = str(obj.relative_filepath)
+    except ValueError:
+        filepath = str(obj.filepath)
+    return {
+        "path": path or obj.path,
+        "kind": obj.kind.value,
+        "message": obj.deprecated if isinstance(obj.deprecated, str) else None,
+        "since": deprecation.since,
+        "alternatives": list(deprecation.alternatives),
+        "params": {
+            name: {"since": since, "alternative": alternative}
+            for name, (since, alternative) in deprecation.params.items()
+        },
+        "category": deprecation.category,
+        "filepath": filepath,
+        "lineno": obj.lineno,
+        "endlineno": obj.endlineno,
+    }
+
+
+def write_inventory(path: str | Path | TextIO, records: Iterable[dict[str, Any]]) -> None:
+    """Write inventory records to a file, in one buffered pass.
+
+    Files with a `.jsonl` suffix get one record per line,
+    other files (and streams) get a JSON array.
+
+    Parameters:
+        path: The file to write, or an open text stream.
+        records: The records to write.
+    """
+    if not isinstance(path, (str, Path)):
+        _write_records(path, records, lines=False)
+        return
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf8", buffering=_BUFFER_SIZE) as file:
+        _write_records(file, records, lines=path.suffix == ".jsonl")
+
+
+def _write_records(file: TextIO, records: Iterable[dict[str, Any]], *, lines: bool) -> None:
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    if lines:
+        file.writelines(f"{encoder.encode(record)}\n" for record in records)
+        return
+    file.write("[")
+    for index, record in enumerate(records):
+        if index:
+            file.write(",\n")
+        file.write(encoder.encode(record))
+    file.write("]\n")
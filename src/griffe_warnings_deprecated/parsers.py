@@ -0,0 +1,198 @@
+"""Parsers of the arguments of deprecation decorators.
+
+A parser receives the positional and keyword arguments of a decorator call, statically evaluated
+(positional arguments that are not literals are `None`, keyword arguments that are not literals are omitted),
+and returns the deprecation data as a dictionary with some of the following keys,
+or `None` if the arguments don't describe a deprecation:
+
+- `message`: the deprecation message;
+- `since`: the version since which the object is deprecated;
+- `alternatives`: paths of the objects to use instead;
+- `params`: deprecated parameters, mapped to a `(since, alternative)` tuple.
+
+Third-party packages can register parsers with entry points in the `griffe_warnings_deprecated.parsers` group,
+named after the decorator path:
+
+```toml
+[project.entry-points."griffe_warnings_deprecated.parsers"]
+"mylib.deprecated" = "mylib.docs:parse_deprecated"
+```
+"""
+
+from __future__ import annotations
+
+import sys
+from functools import lru_cache
+from importlib import import_module
+from importlib.metadata import entry_points
+from typing import Any, Callable, Optional
+
+from griffe import get_logger
+
+logger = get_logger(__name__)
+
+DecoratorParser = Callable[[list[Any], dict[str, Any]], Optional[dict[str, Any]]]
+"""Signature of decorator parsers: positional and keyword arguments to deprecation data."""
+
+ENTRY_POINT_GROUP = "griffe_warnings_deprecated.parsers"
+"""Entry point group of third-party parsers."""
+
+
+def _bind(args: list[Any], kwargs: dict[str, Any], names: tuple[str, ...]) -> dict[str, Any]:
+    bound = dict(zip(names, args))
+    bound.update((name, value) for name, value in kwargs.items() if name in names)
+    return bound
+
+
+def _text(value: Any) -> str | None:
+    return value if isinstance(value, str) else None
+
+
+def _version(value: Any) -> str | None:
+    # Versions are commonly written as numbers, e.g. `since=1.0`.
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    return _text(value)
+
+
+def _paths(value: Any) -> list[str]:
+    # A single string is not split into characters.
+    return [path for path in value if isinstance(path, str)] if isinstance(value, (list, tuple)) else []
+
+
+def parse_pep702(args: list[Any], kwargs: dict[str, Any]) -> dict[str, Any] | None:  # noqa: ARG001
+    """Parse `@warnings.deprecated(message)` (PEP 702).
+
+    Parameters:
+        args: Positional arguments.
+        kwargs: Keyword arguments.
+
+    Returns:
+        The deprecation data.
+    """
+    if args and isinstance(args[0], str):
+        return {"message": args[0]}
+    return None
+
+
+def parse_keywords(args: list[Any], kwargs: dict[str, Any]) -> dict[str, Any] | None:
+    """Parse a PEP 702 message, or `since`, `message`, `alternatives` and `params` keywords.
+
+    This is the parser of configured decorators that have no parser of their own.
+
+    Parameters:
+        args: Positional arguments.
+        kwargs: Keyword arguments.
+
+    Returns:
+        The deprecation data.
+    """
+    if args and isinstance(args[0], str):
+        return {"message": args[0]}
+    since = _version(kwargs.get("since"))
+    if since is None:
+        return None
+    alternatives = kwargs.get("alternatives")
+    if "params" in kwargs:
+        alternatives = alternatives if isinstance(alternatives, dict) else {}
+        return {"params": {param: (since, _text(alternatives.get(param))) for param in _paths(kwargs["params"])}}
+    return {"since": since, "message": _text(kwargs.get("message")), "alternatives": _paths(alternatives)}
+
+
+def parse_deprecation(args: list[Any], kwargs: dict[str, Any]) -> dict[str, Any] | None:
+    """Parse `@deprecation.deprecated(deprecated_in, removed_in, current_version, details)`.
+
+    Parameters:
+        args: Positional arguments.
+        kwargs: Keyword arguments.
+
+    Returns:
+        The deprecation data.
+    """
+    bound = _bind(args, kwargs, ("deprecated_in", "removed_in", "current_version", "details"))
+    since = _version(bound.get("deprecated_in")) or None
+    message = _text(bound.get("details")) or ""
+    if removed_in := _version(bound.get("removed_in")):
+        message = f"{message}\n\nIt will be removed in {removed_in}.".lstrip()
+    return {"since": since, "message": message or (None if since else "")}
+
+
+def parse_deprecated(args: list[Any], kwargs: dict[str, Any]) -> dict[str, Any] | None:
+    """Parse `@deprecated.deprecated(reason, version)` (Deprecated package, classic and Sphinx flavors).
+
+    Parameters:
+        args: Positional arguments.
+        kwargs: Keyword arguments.
+
+    Returns:
+        The deprecation data.
+    """
+    bound = _bind(args, kwargs, ("reason", "version"))
+    since = _version(bound.get("version")) or None
+    message = _text(bound.get("reason")) or None
+    return {"since": since, "message": message if message or since else ""}
+
+
+def parse_deprecate_kwarg(args: list[Any], kwargs: dict[str, Any]) -> dict[str, Any] | None:
+    """Parse pandas' `@deprecate_kwarg(old_arg_name, new_arg_name)`.
+
+    Parameters:
+        args: Positional arguments.
+        kwargs: Keyword arguments.
+
+    Returns:
+        The deprecation data.
+    """
+    bound = _bind(args, kwargs, ("old_arg_name", "new_arg_name"))
+    old = bound.get("old_arg_name")
+    if not isinstance(old, str):
+        return None
+    return {"params": {old: (None, _text(bound.get("new_arg_name")))}}
+
+
+BUILTIN_PARSERS: dict[str, DecoratorParser] = {
+    "warnings.deprecated": parse_pep702,
+    "typing_extensions.deprecated": parse_pep702,
+    "braian.utils.deprecated": parse_keywords,
+    "deprecation.deprecated": parse_deprecation,
+    "deprecated.deprecated": parse_deprecated,
+    "deprecated.classic.deprecated": parse_deprecated,
+    "deprecated.sphinx.deprecated": parse_deprecated,
+    "pandas.util._decorators.deprecate_kwarg": parse_deprecate_kwarg,
+}
+"""Parsers of the supported decorators, by decorator path."""
+
+
+def load_parser(spec: str | DecoratorParser) -> DecoratorParser:
+    """Load a parser from its `module:function` import path.
+
+    Parameters:
+        spec: The import path, or the parser itself.
+
+    Returns:
+        The parser.
+    """
+    if callable(spec):
+        return spec
+    module, _, name = spec.partition(":")
+    return getattr(import_module(module), name)
+
+
+@lru_cache(maxsize=1)
+def entry_point_parsers() -> dict[str, DecoratorParser]:
+    """Load the parsers registered by installed packages, once.
+
+    Returns:
+        The parsers, by decorator path.
+    """
+    if sys.version_info >= (3, 10):
+        points = entry_points(group=ENTRY_POINT_GROUP)
+    else:
+        points = entry_points().get(ENTRY_POINT_GROUP, ())
+    parsers = {}
+    for point in points:
+        try:
+            parsers[point.name] = point.load()
+        except Exception as error:  # noqa: BLE001
+            logger.warning(f"Could not load deprecation parser '{point.name}' ({point.value}): {error}")
+    return parsers
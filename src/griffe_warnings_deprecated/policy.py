@@ -0,0 +1,130 @@
+"""Removal policy: find deprecations that outlived their deprecation window."""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+_PARTS = ("major", "minor", "patch")
+_RELEASE = re.compile(r"\s*v?(\d+(?:\.\d+)*)")
+
+
+def _release(version: str) -> tuple[int, ...] | None:
+    # Only the release segment matters: `1.2.0rc1` and `1.2` both give `(1, 2)`.
+    match = _RELEASE.match(version)
+    if not match:
+        return None
+    release = tuple(int(part) for part in match.group(1).split("."))
+    while len(release) > 1 and release[-1] == 0:
+        release = release[:-1]
+    return release
+
+
+class RemovalPolicy:
+    """Decide whether deprecated objects should have been removed.
+
+    An object deprecated since version `1.2`, with the default policy of one minor version,
+    must be removed in version `1.3`: it is overdue from version `1.3.0` onward.
+
+    Versions are parsed once per distinct `since` string,
+    since large code bases tend to deprecate many objects in a handful of versions.
+    """
+
+    def __init__(self, current_version: str, after: int = 1, part: str = "minor") -> None:
+        """Initialize the policy.
+
+        Parameters:
+            current_version: The current version of the project.
+            after: Number of versions after which deprecated objects must be removed.
+            part: Which part of the version `after` applies to: `major`, `minor` or `patch`.
+
+        Raises:
+            ValueError: When the current version or the part are invalid.
+        """
+        if part not in _PARTS:
+            raise ValueError(f"Invalid version part '{part}', expected one of: {', '.join(_PARTS)}")
+        release = _release(current_version)
+        if release is None:
+            raise ValueError(f"Invalid current version '{current_version}'")
+        self.current_version = current_version
+        """The current version of the project."""
+        self.after = after
+        """Number of versions after which deprecated objects must be removed."""
+        self.part = part
+        """Which part of the version `after` applies to."""
+        self._current = release
+        self._index = _PARTS.index(part)
+        # Removal version and whether it is reached, by `since` string.
+        self._deadlines: dict[str, tuple[str, bool] | None] = {}
+
+    def deadline(self, since: str | float) -> tuple[str, bool] | None:
+        """Compute the version in which objects deprecated in a given version must be removed.
+
+        Parameters:
+            since: The version in which objects were deprecated, numbers are accepted, e.g. `1.2`.
+
+        Returns:
+            The removal version and whether the current version reached it,
+            or `None` if `since` is not a version.
+        """
+        since = str(since)
+        try:
+            return self._deadlines[since]
+        except KeyError:
+            pass
+        release = _release(since)
+        if release is None:
+            result = None
+        else:
+            removal = [*release, 0, 0][: self._index + 1]
+            removal[self._index] += self.after
+            result = (".".join(map(str, removal)), self._current >= tuple(removal))
+        self._deadlines[since] = result
+        return result
+
+    def overdue(self, records: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        """Find the objects and parameters whose removal version is reached.
+
+        Parameters:
+            records: Inventory records,
+                see [`deprecation_record`][griffe_warnings_deprecated.inventory.deprecation_record].
+
+        Yields:
+            Dictionaries with the `path` of the object, the deprecated `parameter` if any
+            (`None` when the object itself is deprecated), the `since` and `removal` versions,
+            and the `filepath` and `lineno` of the object.
+        """
+        for record in records:
+            deprecations = [(None, record["since"])] if record["since"] else []
+            deprecations.extend((name, param["since"]) for name, param in record["params"].items() if param["since"])
+            for parameter, since in deprecations:
+                deadline = self.deadline(since)
+                if deadline and deadline[1]:
+                    yield {
+                        "path": record["path"],
+                        "parameter": parameter,
+                        "since": since,
+                        "removal": deadline[0],
+                        "filepath": record["filepath"],
+                        "lineno": record["lineno"],
+                    }
+
+    @staticmethod
+    def describe(item: dict[str, Any]) -> str:
+        """Describe an overdue deprecation.
+
+        Parameters:
+            item: The overdue deprecation,
+                as found by [`overdue`][griffe_warnings_deprecated.policy.RemovalPolicy.overdue].
+
+        Returns:
+            A one-line message.
+        """
+        subject = f"parameter '{item['parameter']}' of {item['path']}" if item["parameter"] else item["path"]
+        return (
+            f"{item['filepath']}:{item['lineno']}: {subject} is deprecated since {item['since']} "
+            f"and should have been removed in {item['removal']}"
+        )
@@ -0,0 +1,91 @@
+"""Statistics collected by the extension."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field, fields
+from functools import wraps
+from typing import Any, Callable, TypeVar
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+@dataclass
+class ExtensionStats:
+    """Counters and timers collected while loading packages.
+
+    Counters and hook timers are only collected when the extension is created with `stats=True`:
+    otherwise every counter stays at zero, and each counting site costs a single `None` check.
+    """
+
+    modules_visited: int = 0
+    """Number of modules visited."""
+    modules_skipped: int = 0
+    """Number of modules skipped because they import none of the deprecation decorators."""
+    modules_cached: int = 0
+    """Number of modules whose deprecations were read from the on-disk cache."""
+    objects_visited: int = 0
+    """Number of classes, functions and attributes visited."""
+    objects_skipped: int = 0
+    """Number of classes, functions and attributes skipped within skipped modules."""
+    decorators_examined: int = 0
+    """Number of decorators examined."""
+    path_resolutions: int = 0
+    """Number of decorator paths resolved through Griffe."""
+    path_cache_hits: int = 0
+    """Number of decorator paths served from the per-module cache."""
+    literal_evaluations: int = 0
+    """Number of decorator arguments evaluated."""
+    runtime_lookups: int = 0
+    """Number of runtime objects whose `__deprecated__` attribute was looked up, in inspected modules."""
+    bodies_examined: int = 0
+    """Number of function bodies searched for `warnings.warn` calls, after the textual prefilter."""
+    docstring_parses: int = 0
+    """Number of docstring parses forced by the extension (never increases in lazy mode)."""
+    admonitions_inserted: int = 0
+    """Number of deprecation admonitions inserted."""
+    admonitions_shared: int = 0
+    """Number of inserted admonitions that reuse the section of an identical admonition."""
+    parameters_annotated: int = 0
+    """Number of deprecated parameters annotated."""
+    hook_times: dict[str, float] = field(default_factory=dict)
+    """Cumulative wall time spent in each hook, in seconds."""
+
+    def timed(self, name: str, hook: _F) -> _F:
+        """Wrap a hook to accumulate its wall time.
+
+        Parameters:
+            name: The hook name.
+            hook: The hook.
+
+        Returns:
+            The wrapped hook.
+        """
+        self.hook_times.setdefault(name, 0.0)
+        clock = time.perf_counter
+
+        @wraps(hook)
+        def timed_hook(*args: Any, **kwargs: Any) -> Any:
+            start = clock()
+            try:
+                return hook(*args, **kwargs)
+            finally:
+                self.hook_times[name] += clock() - start
+
+        return timed_hook  # type: ignore[return-value]
+
+    def summary(self) -> str:
+        """Summarize the statistics on one line.
+
+        Returns:
+            The summary.
+        """
+        counters = ", ".join(
+            f"{counter.name.replace('_', ' ')}: {getattr(self, counter.name)}"
+            for counter in fields(self)
+            if counter.name != "hook_times"
+        )
+        if not self.hook_times:
+            return counters
+        times = ", ".join(f"{name}: {seconds * 1000:.1f}ms" for name, seconds in self.hook_times.items())
+        return f"{counters}; {times}"
@@ -0,0 +1,233 @@
+"""Find usages of deprecated APIs in downstream source trees."""
+
+from __future__ import annotations
+
+import ast
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+_CHUNK_SIZE = 32
+
+
+class DeprecationIndex:
+    """Deprecated paths of a library, with the prefixes needed to resolve them quickly.
+
+    Modules without an import statement mentioning one of the library's top-level packages
+    are discarded with a regular expression search, before being parsed.
+    Names and attribute chains are only resolved while they are a prefix of some deprecated path,
+    so most of the names of a downstream module are discarded after a single set lookup.
+    """
+
+    def __init__(self, objects: Iterable[str], params: dict[str, frozenset[str]] | None = None) -> None:
+        """Initialize the index.
+
+        Parameters:
+            objects: Paths of the deprecated objects.
+            params: Names of the deprecated parameters, by function path.
+        """
+        self.objects = frozenset(objects)
+        """Paths of the deprecated objects."""
+        self.params = params or {}
+        """Names of the deprecated parameters, by function path."""
+        paths = self.objects | self.params.keys()
+        self.prefixes = frozenset(path.rsplit(".", i)[0] for path in paths for i in range(path.count(".") + 1))
+        """Deprecated paths and all their parent paths."""
+        self.roots = frozenset(path.split(".", 1)[0] for path in paths)
+        """Top-level packages of the deprecated paths."""
+        roots = "|".join(map(re.escape, sorted(self.roots))) or "(?!)"
+        # Matches import statements that may bind one of the root packages.
+        self._imports_re = re.compile(
+            rf"^[ \t]*(?:from[ \t]+(?:{roots})\b|import[ \t][^\n]*\b(?:{roots})\b)",
+            re.MULTILINE,
+        )
+
+    @classmethod
+    def from_inventory(cls, path: str | Path) -> DeprecationIndex:
+        """Build an index from an inventory file (JSON array or JSON lines).
+
+        Parameters:
+            path: The inventory file, as written by the extension or the `scan` command.
+
+        Returns:
+            The index.
+        """
+        text = Path(path).read_text(encoding="utf8")
+        if Path(path).suffix == ".jsonl":
+            records = [json.loads(line) for line in text.splitlines() if line.strip()]
+        else:
+            records = json.loads(text)
+        return cls(
+            (record["path"] for record in records if record["message"] is not None),
+            {record["path"]: frozenset(record["params"]) for record in records if record["params"]},
+        )
+
+    def find(self, source: str, filepath: str = "<string>") -> list[dict[str, Any]]:
+        """Find the usages of deprecated APIs in a module source.
+
+        Parameters:
+            source: The module source.
+            filepath: The module file path, reported in usages.
+
+        Returns:
+            The usages, in source order, with the deprecated `path`, the `kind` of usage
+            (`import`, `access`, or `parameter` for keyword arguments), the `parameter` name if any,
+            and the `filepath`, `lineno` and `col` of the usage.
+        """
+        # Cheap textual prefilter: modules that don't import the library are not parsed.
+        if not self._imports_re.search(source):
+            return []
+        # Collect the relevant nodes in a single walk, then resolve them once imports are known.
+        imports: list[ast.Import | ast.ImportFrom] = []
+        loads: list[ast.Name | ast.Attribute] = []
+        calls: list[ast.Call] = []
+        for node in ast.walk(ast.parse(source, filename=filepath)):
+            if isinstance(node, (ast.Name, ast.Attribute)):
+                if isinstance(node.ctx, ast.Load):
+                    loads.append(node)
+            elif isinstance(node, ast.Call):
+                if node.keywords:
+                    calls.append(node)
+            elif isinstance(node, (ast.Import, ast.ImportFrom)):
+                imports.append(node)
+        bound = dict(self._bindings(imports))
+        if not bound:
+            return []
+        usages: list[dict[str, Any]] = []
+
+        def report(node: ast.AST, path: str, kind: str, parameter: str | None = None) -> None:
+            usages.append(
+                {
+                    "path": path,
+                    "kind": kind,
+                    "parameter": parameter,
+                    "filepath": filepath,
+                    "lineno": node.lineno,  # type: ignore[attr-defined]
+                    "col": node.col_offset,  # type: ignore[attr-defined]
+                },
+            )
+
+        # Resolved paths of `Name` and `Attribute` nodes, so that each chain is only resolved once.
+        resolved: dict[ast.AST, str | None] = {}
+
+        def resolve(node: ast.expr) -> str | None:
+            if node in resolved:
+                return resolved[node]
+            path = None
+            if isinstance(node, ast.Name):
+                path = bound.get(node.id)
+            elif isinstance(node, ast.Attribute):
+                parent = resolve(node.value)
+                if parent is not None:
+                    path = f"{parent}.{node.attr}"
+            resolved[node] = path = path if path in self.prefixes else None
+            return path
+
+        for node in imports:
+            for alias in node.names:
+                path = _imported_path(node, alias)
+                if path in self.objects:
+                    report(node, path, "import")
+        for node in loads:
+            target = resolve(node)
+            if target in self.objects:
+                report(node, target, "access")
+        for node in calls:
+            target = resolve(node.func)
+            if target in self.params:
+                for keyword in node.keywords:
+                    if keyword.arg in self.params[target]:
+                        report(keyword, target, "parameter", keyword.arg)
+        usages.sort(key=lambda usage: (usage["lineno"], usage["col"]))
+        return usages
+
+    def _bindings(self, imports: list[ast.Import | ast.ImportFrom]) -> Iterator[tuple[str, str]]:
+        # Names bound by imports anywhere in the module (scopes are not tracked), limited to indexed paths.
+        for node in imports:
+            for alias in node.names:
+                path = _imported_path(node, alias)
+                if isinstance(node, ast.Import) and not alias.asname:
+                    # `import a.b` binds `a`.
+                    path = path.split(".", 1)[0]
+                if path in self.prefixes:
+                    yield alias.asname or alias.name.split(".", 1)[0], path
+
+
+def _imported_path(node: ast.Import | ast.ImportFrom, alias: ast.alias) -> str:
+    if isinstance(node, ast.ImportFrom) and not node.level and node.module:
+        return f"{node.module}.{alias.name}"
+    # Relative imports stay within the downstream project.
+    return alias.name if isinstance(node, ast.Import) else ""
+
+
+def iter_source_files(paths: Iterable[str | Path]) -> Iterator[str]:
+    """Find the Python files in the given files and directories, in a stable order.
+
+    Hidden directories and `__pycache__` directories are skipped.
+
+    Parameters:
+        paths: Files and directories.
+
+    Yields:
+        File paths.
+    """
+    for path in paths:
+        if not os.path.isdir(path):
+            yield str(path)
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(name for name in dirs if not name.startswith(".") and name != "__pycache__")
+            yield from (os.path.join(root, name) for name in sorted(files) if name.endswith(".py"))
+
+
+_worker_index: DeprecationIndex | None = None
+
+
+def _init_worker(index: DeprecationIndex) -> None:
+    global _worker_index  # noqa: PLW0603
+    _worker_index = index
+
+
+def _scan_file(filepath: str, index: DeprecationIndex | None = None) -> tuple[str, list[dict[str, Any]], str | None]:
+    index = index or _worker_index
+    try:
+        with open(filepath, encoding="utf8") as file:
+            source = file.read()
+        return filepath, index.find(source, filepath), None  # type: ignore[union-attr]
+    except (OSError, UnicodeDecodeError, SyntaxError, ValueError) as error:
+        return filepath, [], f"{error.__class__.__name__}: {error}"
+
+
+def find_usages(
+    index: DeprecationIndex,
+    paths: Iterable[str | Path],
+    workers: int | None = None,
+) -> Iterator[tuple[str, list[dict[str, Any]], str | None]]:
+    """Find the usages of deprecated APIs in source trees, in a process pool.
+
+    Files are parsed one by one in the workers, and results are yielded as soon as they are available
+    (in file order), so that only the usages, not the syntax trees, are kept in memory.
+
+    Parameters:
+        index: The deprecation index.
+        paths: Files and directories to scan.
+        workers: Number of worker processes. With one worker, files are scanned in this process.
+
+    Yields:
+        For each file, its path, its usages, and an error message if it couldn't be scanned.
+    """
+    files = iter_source_files(paths)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        for filepath in files:
+            yield _scan_file(filepath, index)
+        return
+    # The index is sent once per worker, not once per file.
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(index,)) as pool:
+        yield from pool.map(_scan_file, files, chunksize=_CHUNK_SIZE)
@@ -0,0 +1,97 @@
+"""Tests for the `cache` module."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from griffe import load_extensions, visit
+
+from griffe_warnings_deprecated import extension as extension_module
+from griffe_warnings_deprecated.cache import DeprecationCache
+from griffe_warnings_deprecated.extension import WarningsDeprecatedExtension
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+CODE = """
+import warnings
+from braian import utils
+
+@warnings.deprecated("message")
+def hello(): ...
+
+@utils.deprecated(since="1.0", params=["b"], alternatives={"b": "c"})
+def world(a, b, c):
+    '''Summary.
+
+    Parameters:
+        a: A.
+        b: B.
+        c: C.
+    '''
+"""
+
+
+def _visit(tmp_path: Path, code: str = CODE, **options: object) -> tuple[WarningsDeprecatedExtension, dict]:
+    extension = WarningsDeprecatedExtension(cache_dir=str(tmp_path / "cache"), **options)  # type: ignore[arg-type]
+    module = visit(
+        "module",
+        filepath=tmp_path / "module",
+        code=code,
+        extensions=load_extensions(extension),
+        docstring_parser="google",
+    )
+    results = {
+        "hello": (module["hello"].deprecated, module["hello"].docstring.parsed[0].value.contents),
+        "world": [param.description for param in module["world"].docstring.parsed[1].value],
+    }
+    return extension, results
+
+
+def test_unchanged_module_is_not_scanned_again(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that records of unchanged modules are read from the cache."""
+    extension, first = _visit(tmp_path)
+    assert extension.cache
+    assert (extension.cache.hits, extension.cache.misses) == (0, 1)
+
+    def fail(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("decorators should not be scanned")
+
+    monkeypatch.setattr(extension_module, "_scan_decorators", fail)
+    extension, second = _visit(tmp_path)
+    assert extension.cache
+    assert (extension.cache.hits, extension.cache.misses) == (1, 0)
+    assert first == second
+    assert second["hello"] == ("message", "message")
+
+
+@pytest.mark.parametrize(
+    ("code", "options"),
+    [
+        (CODE.replace('"message"', '"other message"'), {}),
+        (CODE, {"decorators": ["warnings.deprecated"]}),
+    ],
+)
+def test_cache_invalidation(tmp_path: Path, code: str, options: dict) -> None:
+    """Test that changes to the source or the decorators registry invalidate the cache.
+
+    Parameters:
+        code: The modified module source (parametrized).
+        options: The modified extension options (parametrized).
+    """
+    _visit(tmp_path)
+    extension, _ = _visit(tmp_path, code, **options)
+    assert extension.cache
+    assert (extension.cache.hits, extension.cache.misses) == (0, 1)
+
+
+def test_corrupted_entry_is_a_miss(tmp_path: Path) -> None:
+    """Test that unreadable cache entries are ignored."""
+    cache = DeprecationCache(tmp_path, ["warnings.deprecated"])
+    key = cache.key("source")
+    cache.save("module", key, {"module.f": {"message": "m"}})
+    assert cache.load("module", key) == {"module.f": {"message": "m"}}
+    for entry in tmp_path.iterdir():
+        entry.write_text("{not json", encoding="utf8")
+    assert cache.load("module", key) is None
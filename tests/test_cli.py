@@ -0,0 +1,82 @@
+"""Tests for the `cli` module."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from griffe_warnings_deprecated import cli
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def search_path(tmp_path: Path) -> Path:
+    """Write two packages with deprecated objects.
+
+    Parameters:
+        tmp_path: Pytest fixture.
+
+    Returns:
+        The directory containing the packages.
+    """
+    for package, code in {
+        "pkg_a": "import warnings\n@warnings.deprecated('a')\ndef f(): ...\n",
+        "pkg_b": "import warnings\nclass B:\n    @warnings.deprecated('b')\n    def m(self): ...\n",
+    }.items():
+        (tmp_path / package).mkdir()
+        (tmp_path / package / "__init__.py").write_text(code, encoding="utf8")
+    return tmp_path
+
+
+def test_show_help(capsys: pytest.CaptureFixture) -> None:
+    """Show help.
+
+    Parameters:
+        capsys: Pytest fixture to capture output.
+    """
+    with pytest.raises(SystemExit):
+        cli.main(["-h"])
+    captured = capsys.readouterr()
+    assert "griffe-deprecations" in captured.out
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_scan(search_path: Path, workers: int, capsys: pytest.CaptureFixture) -> None:
+    """Scan several packages and merge their records.
+
+    Parameters:
+        search_path: Directory containing the packages.
+        workers: Number of worker processes (parametrized).
+        capsys: Pytest fixture to capture output.
+    """
+    output = search_path / "report.json"
+    args = ["scan", "pkg_b", "pkg_a", "missing", "-s", str(search_path), "-j", str(workers), "-o", str(output)]
+    assert cli.main(args) == 1
+    records = json.loads(output.read_text(encoding="utf8"))
+    assert [(record["path"], record["message"]) for record in records] == [("pkg_a.f", "a"), ("pkg_b.B.m", "b")]
+    stderr = capsys.readouterr().err
+    assert "[3/3]" in stderr
+    assert "error: could not scan missing" in stderr
+
+
+def test_check(search_path: Path, capsys: pytest.CaptureFixture) -> None:
+    """Fail when deprecations are past their removal version.
+
+    Parameters:
+        search_path: Directory containing the packages.
+        capsys: Pytest fixture to capture output.
+    """
+    (search_path / "pkg_c").mkdir()
+    (search_path / "pkg_c" / "__init__.py").write_text(
+        "from braian.utils import deprecated\n@deprecated(since='0.9')\ndef f(): ...\n",
+        encoding="utf8",
+    )
+    args = ["check", "1.0", "pkg_a", "pkg_c", "-s", str(search_path), "-j", "1"]
+    assert cli.main(args) == 1
+    assert "pkg_c.f is deprecated since 0.9 and should have been removed in 0.10" in capsys.readouterr().out
+    assert cli.main(["check", "0.9.3", "pkg_a", "pkg_c", "-s", str(search_path), "-j", "1", "-q"]) == 0
+    assert capsys.readouterr().out == ""
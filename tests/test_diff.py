@@ -0,0 +1,132 @@
+"""Tests for the `diff` module."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from collections import Counter
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from griffe_warnings_deprecated import extension as extension_module
+from griffe_warnings_deprecated.cli import main
+from griffe_warnings_deprecated.diff import diff_refs
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+OLD = {
+    "unchanged.py": "import warnings\n@warnings.deprecated('same')\ndef same(): ...\n",
+    "changed.py": (
+        "import warnings\n"
+        "@warnings.deprecated('old message')\ndef reworded(): ...\n"
+        "@warnings.deprecated('removed')\ndef restored(): ...\n"
+        "def newly(): ...\n"
+    ),
+}
+NEW = {
+    "changed.py": (
+        "import warnings\n"
+        "@warnings.deprecated('new message')\ndef reworded(): ...\n"
+        "def restored(): ...\n"
+        "@warnings.deprecated('now deprecated')\ndef newly(): ...\n"
+    ),
+}
+
+
+GIT = shutil.which("git") or "git"
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run([GIT, *args], cwd=repo, check=True)  # noqa: S603
+
+
+def _commit(repo: Path, files: dict[str, str], message: str) -> None:
+    for name, code in files.items():
+        (repo / "pkg" / name).write_text(code, encoding="utf8")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-qm", message)
+    _git(repo, "tag", message)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """Create a git repository with two tagged versions of a package.
+
+    Parameters:
+        tmp_path: Pytest fixture.
+
+    Returns:
+        The repository path.
+    """
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "__init__.py").touch()
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.name", "Test")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _commit(tmp_path, OLD, "v1")
+    _commit(tmp_path, NEW, "v2")
+    return tmp_path
+
+
+def test_diff_refs(repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the differences between two references, and that unchanged modules are scanned once.
+
+    Parameters:
+        repo: A git repository.
+        monkeypatch: Pytest fixture.
+    """
+    scanned: Counter[str] = Counter()
+    scan = extension_module._scan_decorators
+
+    def counting_scan(obj: Any, *args: Any, **kwargs: Any) -> Any:
+        scanned[obj.path] += 1
+        return scan(obj, *args, **kwargs)
+
+    monkeypatch.setattr(extension_module, "_scan_decorators", counting_scan)
+    differences = diff_refs("pkg", "v1", "v2", repo=repo)
+    assert [record["path"] for record in differences["deprecated"]] == ["pkg.changed.newly"]
+    assert [record["path"] for record in differences["undeprecated"]] == ["pkg.changed.restored"]
+    assert [record["filepath"] for record in differences["deprecated"]] == ["pkg/changed.py"]
+    assert [record["filepath"] for record in differences["undeprecated"]] == ["pkg/changed.py"]
+    assert differences["changed"] == [
+        {
+            "path": "pkg.changed.reworded",
+            "before": {"message": "old message", "since": None, "alternatives": [], "params": {}},
+            "after": {"message": "new message", "since": None, "alternatives": [], "params": {}},
+        },
+    ]
+    assert scanned["pkg.unchanged.same"] == 1
+    assert scanned["pkg.changed.reworded"] == 2
+
+
+def test_diff_refs_src_layout(tmp_path: Path) -> None:
+    """Report file paths relative to the repository root for packages found in search paths.
+
+    Parameters:
+        tmp_path: Pytest fixture.
+    """
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "pkg" / "__init__.py").touch()
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.name", "Test")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _commit(tmp_path / "src", OLD, "v1")
+    _commit(tmp_path / "src", NEW, "v2")
+    differences = diff_refs("pkg", "v1", "v2", repo=tmp_path, search_paths=["src"])
+    assert [record["filepath"] for record in differences["deprecated"]] == ["src/pkg/changed.py"]
+
+
+def test_diff_command(repo: Path, capsys: pytest.CaptureFixture) -> None:
+    """Test the `diff` command.
+
+    Parameters:
+        repo: A git repository.
+        capsys: Pytest fixture to capture output.
+    """
+    assert main(["diff", "pkg", "v1", "v2", "--repo", str(repo)]) == 0
+    captured = capsys.readouterr()
+    assert '"deprecated"' in captured.out
+    assert "pkg v1..v2: 1 deprecated, 1 undeprecated, 1 changed" in captured.err
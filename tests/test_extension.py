@@ -4,11 +4,16 @@ from __future__ import annotations
 
 import logging
 from textwrap import dedent
+from typing import TYPE_CHECKING
 
 import pytest
-from griffe import DocstringAdmonition, DocstringSectionAdmonition, load_extensions, temporary_visited_module
+from griffe import DocstringAdmonition, DocstringSectionAdmonition, DocstringSectionParameters, load_extensions, temporary_inspected_module, temporary_visited_module, temporary_visited_package
 
-from griffe_warnings_deprecated.extension import WarningsDeprecatedExtension
+from griffe_warnings_deprecated.extension import WarningsDeprecatedExtension, _literal, deprecation_info
+from griffe_warnings_deprecated.stats import ExtensionStats
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 @pytest.mark.parametrize(
@@ -102,3 +107,654 @@ def test_extension_fstring(caplog: pytest.LogCaptureFixture) -> None:
     # Expect no deprecation message in the docstring.
     assert adm is None
     assert "f'message' is not a static string" in caplog.records[0].message
+
+
+def test_lazy_docstring_edits() -> None:
+    """Test that lazy mode only edits docstrings when they are parsed."""
+    code = dedent(
+        """
+        import warnings
+        @warnings.deprecated("message")
+        def hello():
+            '''Summary.'''
+        """,
+    )
+    extension = WarningsDeprecatedExtension(lazy=True)
+    with temporary_visited_module(code, extensions=load_extensions(extension)) as module:
+        docstring = module["hello"].docstring
+        assert "parsed" not in docstring.__dict__
+        sections = docstring.parsed
+    assert isinstance(sections[0], DocstringSectionAdmonition)
+    assert sections[0].value.contents == "message"
+    assert sections[1].value == "Summary."
+
+
+def test_keyword_style_deprecation() -> None:
+    """Test deprecations declared with `since=` and `alternatives=` keywords."""
+    code = dedent(
+        """
+        from braian import utils
+        @utils.deprecated(since="1.0", message="Old.", alternatives=["module.new"])
+        def hello(): ...
+        """,
+    )
+    with temporary_visited_module(code, extensions=load_extensions(WarningsDeprecatedExtension)) as module:
+        hello = module["hello"]
+        adm = hello.docstring.parsed[0]
+    assert hello.deprecated == adm.value.contents
+    assert adm.value.contents == (
+        "`hello` is deprecated since 1.0 and may be removed in future versions."
+        "\n\nOld.\n\n**Alternative**: [`new`][module.new]"
+    )
+    assert "deprecated" in hello.labels
+
+
+def test_deprecated_params() -> None:
+    """Test deprecations of parameters declared with the `params=` keyword."""
+    code = dedent(
+        """
+        from braian import utils
+        @utils.deprecated(since="1.0", params=["b"], alternatives=dict(b="c"))
+        def hello(a, b, c):
+            '''Summary.
+
+            Parameters:
+                a: A.
+                b: B.
+                c: C.
+            '''
+        """,
+    )
+    with temporary_visited_module(
+        code,
+        extensions=load_extensions(WarningsDeprecatedExtension),
+        docstring_parser="google",
+    ) as module:
+        hello = module["hello"]
+        params = hello.docstring.parsed[1].value
+    assert not hello.deprecated
+    assert [p.description for p in params] == ["A.", "**Deprecated since 1.0**: use `c` instead.\n\nB.", "C."]
+
+
+@pytest.mark.parametrize(
+    ("argument", "expected"),
+    [
+        ("'message'", "message"),
+        ('"it\'s"', "it's"),
+        ("'line\\nbreak'", "line\nbreak"),
+        ('"""triple"""', "triple"),
+        ("['a', 'b']", ["a", "b"]),
+        ("{'a': 'b'}", {"a": "b"}),
+        ("dict(a='b')", {"a": "b"}),
+        ("1.5", 1.5),
+    ],
+)
+def test_literal_evaluation(argument: str, expected: object) -> None:
+    """Test the evaluation of constant decorator arguments.
+
+    Parameters:
+        argument: Decorator argument (parametrized).
+        expected: Expected value (parametrized).
+    """
+    code = f"@deco({argument})\ndef hello(): ..."
+    with temporary_visited_module(code) as module:
+        expr = module["hello"].decorators[0].value.arguments[0]
+    assert _literal(expr) == expected
+
+
+def test_literal_evaluation_spread() -> None:
+    """Reject dictionaries spreading other dictionaries, like `literal_eval` does."""
+    with temporary_visited_module("@deco({'a': 'b', **other})\ndef hello(): ...") as module:
+        expr = module["hello"].decorators[0].value.arguments[0]
+    with pytest.raises(ValueError, match="malformed"):
+        _literal(expr)
+
+
+@pytest.mark.parametrize(
+    ("imports", "skipped"),
+    [
+        ("import functools", True),
+        ("from typing import TYPE_CHECKING\nif TYPE_CHECKING:\n    import functools", True),
+        ("import warnings", False),
+        ("from warnings import deprecated as old", False),
+        ("try:\n    from warnings import deprecated\nexcept ImportError:\n    from typing_extensions import deprecated", False),
+        ("from braian import utils", False),
+    ],
+)
+def test_module_prefilter(imports: str, skipped: bool) -> None:
+    """Test that modules importing no deprecation decorator are skipped.
+
+    Parameters:
+        imports: Import statements of the module (parametrized).
+        skipped: Whether the module should be skipped (parametrized).
+    """
+    code = f"{imports}\n\ndef hello(): ...\n\nclass World: ...\n"
+    extension = WarningsDeprecatedExtension(stats=True)
+    with temporary_visited_module(code, extensions=load_extensions(extension)):
+        pass
+    assert extension.stats.modules_skipped == int(skipped)
+    assert extension.stats.objects_skipped == (2 if skipped else 0)
+
+
+@pytest.mark.parametrize(
+    ("decorators", "deprecated"),
+    [
+        (None, {"pep702", "aliased"}),
+        (["mylib.compat.deprecated"], {"compat"}),
+        (["*.deprecated"], {"pep702", "aliased", "compat"}),
+        (["warnings.deprecated", "mylib.*.old_*"], {"pep702", "aliased", "custom", "dotted"}),
+        (["mylib.compat.old_api"], {"custom", "dotted"}),
+    ],
+)
+def test_configured_decorators(decorators: list[str] | None, deprecated: set[str]) -> None:
+    """Test user-supplied decorator paths and patterns.
+
+    Parameters:
+        decorators: Configured decorator paths (parametrized).
+        deprecated: Names of the functions expected to be deprecated (parametrized).
+    """
+    code = dedent(
+        """
+        import warnings
+        from warnings import deprecated as dep
+        from mylib.compat import deprecated
+        from mylib.compat import old_api
+        @warnings.deprecated("message")
+        def pep702(): ...
+        @dep("message")
+        def aliased(): ...
+        @deprecated("message")
+        def compat(): ...
+        @old_api("message")
+        def custom(): ...
+        """,
+    )
+    extension = WarningsDeprecatedExtension(decorators=decorators)
+    with temporary_visited_module(code, extensions=load_extensions(extension)) as module:
+        assert {name for name, member in module.members.items() if member.deprecated} == deprecated - {"dotted"}
+    # Only the top-level package is imported: patterns must not skip the module.
+    code = 'import mylib\n@mylib.compat.old_api("message")\ndef dotted(): ...\n'
+    with temporary_visited_module(code, extensions=load_extensions(extension)) as module:
+        assert bool(module["dotted"].deprecated) is ("dotted" in deprecated)
+
+
+def test_decorator_path_cache() -> None:
+    """Test that identical decorators are resolved once per module."""
+    code = "import warnings\n" + "".join(
+        f"@warnings.deprecated('message')\ndef hello{index}(): ...\n" for index in range(5)
+    )
+    extension = WarningsDeprecatedExtension(stats=True)
+    with temporary_visited_module(code, extensions=load_extensions(extension)) as module:
+        assert all(module[f"hello{index}"].deprecated for index in range(5))
+    assert extension.stats.path_resolutions == 1
+    assert extension.stats.path_cache_hits == 4
+
+
+def test_stats(caplog: pytest.LogCaptureFixture) -> None:
+    """Test the statistics collected by the extension, only when enabled."""
+    code = dedent(
+        """
+        import functools
+        import warnings
+        @functools.cache
+        @warnings.deprecated("message")
+        def hello(): ...
+        def world(): ...
+        """,
+    )
+    extension = WarningsDeprecatedExtension(stats=True)
+    with (
+        caplog.at_level(logging.DEBUG),
+        temporary_visited_package("pkg", {"__init__.py": code}, extensions=load_extensions(extension)),
+    ):
+        pass
+    stats = extension.stats
+    assert (stats.modules_visited, stats.objects_visited, stats.decorators_examined) == (1, 2, 2)
+    assert (stats.path_resolutions, stats.literal_evaluations) == (1, 1)
+    assert (stats.docstring_parses, stats.admonitions_inserted, stats.parameters_annotated) == (1, 1, 0)
+    assert set(stats.hook_times) >= {"on_module_instance", "on_function_instance"}
+    assert stats.hook_times["on_function_instance"] > 0
+    assert any(record.message.startswith("Deprecations in pkg: modules visited: 1") for record in caplog.records)
+
+    caplog.clear()
+    extension = WarningsDeprecatedExtension()
+    with (
+        caplog.at_level(logging.DEBUG),
+        temporary_visited_package("pkg", {"__init__.py": code}, extensions=load_extensions(extension)),
+    ):
+        pass
+    assert extension.stats.summary() == ExtensionStats().summary()
+    assert not any(record.message.startswith("Deprecations in pkg") for record in caplog.records)
+
+
+def test_deprecated_params_in_other_sections() -> None:
+    """Test that deprecated parameters are annotated in every parameters section."""
+    code = dedent(
+        """
+        from braian import utils
+        @utils.deprecated(since="2.0", params=["b", "kwargs"])
+        def hello(a, b, **kwargs):
+            '''Summary.
+
+            Parameters:
+                a: A.
+
+            Other Parameters:
+                b: B.
+                **kwargs: Keyword arguments.
+            '''
+        """,
+    )
+    extension = WarningsDeprecatedExtension(stats=True)
+    with temporary_visited_module(
+        code,
+        extensions=load_extensions(extension),
+        docstring_parser="google",
+    ) as module:
+        sections = module["hello"].docstring.parsed
+    assert [p.description for p in sections[1].value] == ["A."]
+    assert [p.description for p in sections[2].value] == [
+        "**Deprecated since 2.0**\n\nB.",
+        "**Deprecated since 2.0**\n\nKeyword arguments.",
+    ]
+    assert extension.stats.parameters_annotated == 2
+
+
+@pytest.mark.parametrize("docstring", ["...", "'''Summary.'''"])
+def test_deprecated_params_of_undocumented_functions(docstring: str) -> None:
+    """Test that a parameters section is built for functions that document no parameters.
+
+    Parameters:
+        docstring: The function docstring (parametrized).
+    """
+    code = dedent(
+        f"""
+        from braian import utils
+        class World:
+            @utils.deprecated(since="1.0", params=["b"], alternatives={{"b": "c"}})
+            def hello(self, a: int, b: str = "b", c: str = "c"):
+                {docstring}
+        """,
+    )
+    with temporary_visited_module(
+        code,
+        extensions=load_extensions(WarningsDeprecatedExtension),
+        docstring_parser="google",
+    ) as module:
+        section = module["World.hello"].docstring.parsed[-1]
+    assert isinstance(section, DocstringSectionParameters)
+    assert [(p.name, str(p.annotation), str(p.value), p.description) for p in section.value] == [
+        ("a", "int", "None", ""),
+        ("b", "str", "'b'", "**Deprecated since 1.0**: use `c` instead."),
+        ("c", "str", "'c'", ""),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("body", "message"),
+    [
+        ('warnings.warn("Use new.", DeprecationWarning, stacklevel=2)', "Use new."),
+        ('w.warn(message="Use new.", category=FutureWarning)', "Use new."),
+        ('warn(f"Use {new}.", builtins.PendingDeprecationWarning)', "Use {new}."),
+        ('"""Summary."""\n    x = 1\n    warnings.warn("Use new.", DeprecationWarning)', "Use new."),
+        ('x = 1\n    y = 2\n    warnings.warn("Use new.", DeprecationWarning)', None),
+        ('warnings.warn("Careful.", UserWarning)', None),
+        ('warnings.warn("Use new.")', None),
+        ("warnings.warn(message=msg, category=DeprecationWarning)", "`hello` is deprecated."),
+        ("warnings.warn(category=DeprecationWarning)", "`hello` is deprecated."),
+        ('other.warn("Use new.", DeprecationWarning)', None),
+    ],
+)
+def test_warn_calls(body: str, message: str | None) -> None:
+    """Detect `warnings.warn` calls in the first statements of functions.
+
+    Parameters:
+        body: The function body (parametrized).
+        message: The expected deprecation message (parametrized).
+    """
+    code = f"import warnings\nimport warnings as w\nfrom warnings import warn\ndef hello():\n    {body}\n"
+    extension = WarningsDeprecatedExtension(warn_calls=2)
+    with temporary_visited_module(code, extensions=load_extensions(extension)) as module:
+        assert module["hello"].deprecated == message
+        assert ("deprecated" in module["hello"].labels) is (message is not None)
+        if message is not None:
+            assert module["hello"].docstring.parsed[0].value.contents == message
+
+
+def test_warn_calls_prefilter() -> None:
+    """Only walk the bodies of functions that mention warnings, in modules importing `warnings`."""
+    code = dedent(
+        """
+        import warnings
+        def hello():
+            return 1
+        def world():
+            warnings.warn("Careful.", UserWarning)
+        """,
+    )
+    extension = WarningsDeprecatedExtension(warn_calls=3, stats=True)
+    with temporary_visited_module(code, extensions=load_extensions(extension)) as module:
+        assert not module["hello"].deprecated
+        assert not module["world"].deprecated
+    assert extension.stats.bodies_examined == 1
+
+    extension = WarningsDeprecatedExtension(warn_calls=3, stats=True)
+    code = 'def hello():\n    warn("Use new.", DeprecationWarning)\n'
+    with temporary_visited_module(code, extensions=load_extensions(extension)) as module:
+        assert not module["hello"].deprecated
+    assert (extension.stats.modules_skipped, extension.stats.bodies_examined) == (1, 0)
+
+
+def test_runtime_deprecations() -> None:
+    """Read `__deprecated__` attributes of inspected objects."""
+    code = dedent(
+        """
+        def deprecated(message):
+            # Set `__deprecated__` like PEP 702 decorators, without their runtime warnings.
+            def decorator(obj):
+                obj.__deprecated__ = message
+                return obj
+            return decorator
+
+        @deprecated("Use g.")
+        def f(): ...
+
+        @deprecated("Use B.")
+        class A:
+            @deprecated("Use n.")
+            def m(self): ...
+
+            @staticmethod
+            @deprecated("Use t.")
+            def s(): ...
+
+            @property
+            @deprecated("Use q.")
+            def p(self): ...
+
+        class Sub(A):
+            def m(self): ...
+
+        def g(): ...
+        """,
+    )
+    extension = WarningsDeprecatedExtension(stats=True)
+    with temporary_inspected_module(code, extensions=load_extensions(extension)) as module:
+        assert module["f"].deprecated == "Use g."
+        assert module["A"].deprecated == "Use B."
+        assert module["A.m"].deprecated == "Use n."
+        assert module["A.s"].deprecated == "Use t."
+        assert module["A.p"].deprecated == "Use q."
+        assert not module["Sub"].deprecated
+        assert not module["Sub.m"].deprecated
+        assert not module["g"].deprecated
+        assert "deprecated" in module["f"].labels
+    assert extension.stats.runtime_lookups >= 6
+
+
+def test_runtime_deprecations_with_proxies() -> None:
+    """Skip objects whose attributes can't be accessed, like unbound context-local proxies."""
+    code = dedent(
+        """
+        class LocalProxy:
+            def __getattribute__(self, name):
+                if name == "__dict__":
+                    raise RuntimeError("Working outside of application context.")
+                return super().__getattribute__(name)
+
+        request = LocalProxy()
+
+        def f(): ...
+
+        f.__deprecated__ = "Use g."
+        """,
+    )
+    with temporary_inspected_module(code, extensions=load_extensions(WarningsDeprecatedExtension)) as module:
+        assert module["f"].deprecated == "Use g."
+        assert not module["request"].deprecated
+
+
+def test_inherited_deprecations() -> None:
+    """Mark subclasses of deprecated classes and methods overriding deprecated methods."""
+    code = dedent(
+        """
+        import warnings
+
+        @warnings.deprecated("Use New.")
+        class Old:
+            @warnings.deprecated("Use run.")
+            def start(self): ...
+
+        class Base:
+            @warnings.deprecated("Use run.")
+            def start(self): ...
+
+        class Child(Old):
+            def start(self): ...
+
+        class GrandChild(Child, Base):
+            def start(self): ...
+            def run(self): ...
+
+        class Unrelated:
+            def start(self): ...
+        """,
+    )
+    extension = WarningsDeprecatedExtension(inherited=True)
+    with temporary_visited_package("pkg", {"__init__.py": code}, extensions=load_extensions(extension)) as package:
+
+        def admonition(path: str) -> str | None:
+            sections = package[path].docstring.parsed if package[path].docstring else []
+            texts = [section.value.contents for section in sections if isinstance(section, DocstringSectionAdmonition)]
+            return texts[0] if texts else None
+
+        assert admonition("Child") == "Inherits from deprecated class [`Old`][pkg.Old]."
+        assert admonition("GrandChild") == "Inherits from deprecated class [`Old`][pkg.Old]."
+        assert admonition("Child.start") == "Overrides deprecated method [`Old.start`][pkg.Old.start]."
+        assert admonition("GrandChild.start") == "Overrides deprecated method [`Old.start`][pkg.Old.start]."
+        assert admonition("GrandChild.run") is None
+        assert admonition("Unrelated") is None
+        assert admonition("Unrelated.start") is None
+        assert admonition("Old") == "Use New."
+        assert not package["Child"].deprecated
+
+
+def test_cascade() -> None:
+    """Mark the members of deprecated classes and modules."""
+    modules = {
+        "__init__.py": "",
+        "old.py": '__deprecated__ = "Use new."\ndef f(): ...\n',
+        "legacy.py": "class A: ...\n",
+        "new.py": dedent(
+            """
+            import warnings
+
+            @warnings.deprecated("Use B.")
+            class A:
+                x: int = 0
+                def m(self): ...
+                @warnings.deprecated("Use n.")
+                def d(self): ...
+                class Inner:
+                    def n(self): ...
+
+            class B:
+                def m(self): ...
+            """,
+        ),
+    }
+    extension = WarningsDeprecatedExtension(
+        cascade=True,
+        cascade_admonition=True,
+        deprecated_modules={"pkg.legacy": "Gone."},
+    )
+    with temporary_visited_package("pkg", modules, extensions=load_extensions(extension)) as package:
+        assert package["old"].deprecated == "Use new."
+        assert package["legacy"].deprecated == "Gone."
+        assert "deprecated" in package["old"].labels
+        for path in ("old.f", "legacy.A", "new.A.x", "new.A.m", "new.A.Inner", "new.A.Inner.n"):
+            assert "deprecated-parent" in package[path].labels, path
+            assert not package[path].deprecated
+        assert "deprecated-parent" not in package["new.A.d"].labels
+        assert "deprecated-parent" not in package["new.B.m"].labels
+        sections = package["new.A.Inner.n"].docstring.parsed
+        assert sections[0].value.contents == "Member of deprecated class [`A`][pkg.new.A]."
+        assert {record["path"] for record in extension.records("pkg")} >= {"pkg.old", "pkg.legacy", "pkg.new.A"}
+
+
+def test_module_marker_without_cascade() -> None:
+    """Deprecate modules with a marker, without marking their members."""
+    modules = {"__init__.py": "", "old.py": '__deprecated__ = "Use new."\ndef f(): ...\n'}
+    with temporary_visited_package("pkg", modules, extensions=load_extensions(WarningsDeprecatedExtension)) as package:
+        assert package["old"].deprecated == "Use new."
+        assert not package["old.f"].labels
+
+
+def test_deprecation_info() -> None:
+    """Store compact deprecation data in the `extra` attribute of deprecated objects."""
+    code = """
+    import warnings
+    from braian import utils
+
+    @warnings.deprecated("Use g.", category=FutureWarning)
+    def f(): ...
+
+    @warnings.deprecated("Use h.")
+    def g(): ...
+
+    @utils.deprecated(since="1.0", alternatives=["module.g"])
+    def h(): ...
+
+    @utils.deprecated(since="1.0", params=["b"])
+    def k(a, b): ...
+    """
+    with temporary_visited_module(dedent(code), extensions=load_extensions(WarningsDeprecatedExtension)) as module:
+        info = deprecation_info(module["f"])
+        assert info.as_dict() == {"message": "Use g.", "category": "FutureWarning"}
+        assert not hasattr(info, "__dict__")
+        assert not module["g"].extra
+        assert deprecation_info(module["g"]).as_dict() == {"message": "Use h."}
+        assert deprecation_info(module["h"]).alternatives == ("module.g",)
+        assert deprecation_info(module["h"]).since is deprecation_info(module["k"]).params["b"][0]
+        assert not module["k"].deprecated
+        assert deprecation_info(module) is None
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_shared_admonitions(lazy: bool) -> None:
+    """Share one admonition section between objects with identical deprecations.
+
+    Parameters:
+        lazy: Whether docstring edits are deferred (parametrized).
+    """
+    code = """
+    import warnings
+
+    @warnings.deprecated("Use new.")
+    def f(): ...
+
+    @warnings.deprecated("Use new.")
+    def g():
+        '''Summary.'''
+
+    @warnings.deprecated("Use other.")
+    def h(): ...
+    """
+    extension = WarningsDeprecatedExtension(lazy=lazy, stats=True)
+    with temporary_visited_module(dedent(code), extensions=load_extensions(extension)) as module:
+        f, g, h = (module[name].docstring.parsed[0] for name in "fgh")
+        assert f is g
+        assert f is not h
+        assert g.value.contents == "Use new."
+    assert extension.stats.admonitions_shared == 1
+
+
+def test_deprecated_overloads(tmp_path: Path) -> None:
+    """List the deprecated overloads of a function in a single admonition, also when read from the cache.
+
+    Parameters:
+        tmp_path: A temporary directory for the cache.
+    """
+    code = """
+    import warnings
+    from typing import overload
+
+    class A:
+        @overload
+        def f(self, x: int, /) -> int: ...
+        @overload
+        @warnings.deprecated("Pass ints.")
+        def f(self, x: str, *, strict: bool = False) -> str: ...
+        def f(self, x, strict=False):
+            '''Summary.'''
+    """
+    for _ in range(2):
+        extension = WarningsDeprecatedExtension(cache_dir=tmp_path, stats=True)
+        with temporary_visited_module(dedent(code), extensions=load_extensions(extension)) as module:
+            func = module["A.f"]
+            assert not func.deprecated
+            assert [overload.deprecated for overload in func.overloads] == [None, "Pass ints."]
+            assert "deprecated" in func.overloads[1].labels
+            sections = func.docstring.parsed
+            assert sections[0].value.contents == (
+                "The following signature is deprecated:\n\n- `f(x: str, *, strict: bool = False) -> str`: Pass ints."
+            )
+            assert len(sections) == 2
+        assert (extension.stats.docstring_parses, extension.stats.admonitions_inserted) == (1, 1)
+
+
+def test_record_deprecated_overloads() -> None:
+    """Record deprecated overloads under the path of their implementation and their line number."""
+    code = """
+    import warnings
+    from typing import overload
+
+    @overload
+    def f(x: int) -> int: ...
+    @overload
+    @warnings.deprecated("Pass ints.")
+    def f(x: str) -> str: ...
+    def f(x): ...
+    """
+    extension = WarningsDeprecatedExtension()
+    with temporary_visited_package("pkg", {"__init__.py": dedent(code)}, extensions=load_extensions(extension)):
+        pass
+    [record] = extension.records("pkg")
+    assert (record["path"], record["message"], record["lineno"]) == ("pkg.f@7", "Pass ints.", 7)
+
+
+def test_deprecated_attributes() -> None:
+    """Deprecate properties, cached properties, and attributes assigned deprecated objects."""
+    code = """
+    import warnings
+    from functools import cached_property
+
+    def _g(): ...
+
+    g = warnings.deprecated("Use h.")(_g)
+    h = print(_g)
+
+    class A:
+        @property
+        @warnings.deprecated("Use y.")
+        def x(self) -> int:
+            '''Docstring.'''
+
+        @cached_property
+        @warnings.deprecated("Use w.")
+        def z(self) -> int: ...
+
+        @property
+        def y(self) -> int: ...
+    """
+    extension = WarningsDeprecatedExtension()
+    with temporary_visited_module(dedent(code), extensions=load_extensions(extension)) as module:
+        for path, message in (("g", "Use h."), ("A.x", "Use y."), ("A.z", "Use w.")):
+            attribute = module[path]
+            assert attribute.is_attribute
+            assert attribute.deprecated == message
+            assert "deprecated" in attribute.labels
+            assert attribute.docstring.parsed[0].value.contents == message
+        assert not module["h"].deprecated
+        assert not module["A.y"].deprecated
+    assert {obj.path for obj in extension._deprecated_objects} == {"module.g", "module.A.x", "module.A.z"}
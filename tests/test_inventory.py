@@ -0,0 +1,53 @@
+"""Tests for the `inventory` module."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+from griffe import load_extensions, temporary_visited_package
+
+from griffe_warnings_deprecated.extension import WarningsDeprecatedExtension
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+FILES = {
+    "__init__.py": "",
+    "module.py": """
+import warnings
+from braian import utils
+
+@warnings.deprecated("message")
+class Old: ...
+
+def fine(): ...
+
+@utils.deprecated(since="1.0", params=["b"], alternatives={"b": "c"})
+def world(a, b, c): ...
+""",
+}
+
+
+@pytest.mark.parametrize("suffix", [".json", ".jsonl"])
+def test_inventory_export(tmp_path: Path, suffix: str) -> None:
+    """Test that deprecated objects are written to the inventory.
+
+    Parameters:
+        suffix: The inventory file suffix (parametrized).
+    """
+    inventory = tmp_path / f"{{package}}{suffix}"
+    extension = WarningsDeprecatedExtension(inventory=str(inventory))
+    with temporary_visited_package("pkg", FILES, extensions=load_extensions(extension)):
+        pass
+    text = (tmp_path / f"pkg{suffix}").read_text(encoding="utf8")
+    records = json.loads(text) if suffix == ".json" else [json.loads(line) for line in text.splitlines()]
+    assert [record["path"] for record in records] == ["pkg.module.Old", "pkg.module.world"]
+    old, world = records
+    assert old["kind"] == "class"
+    assert old["message"] == "message"
+    assert old["filepath"].endswith("module.py")
+    assert old["lineno"] == 5
+    assert world["message"] is None
+    assert world["params"] == {"b": {"since": "1.0", "alternative": "c"}}
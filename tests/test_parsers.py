@@ -0,0 +1,149 @@
+"""Tests for the `parsers` module."""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import Any
+
+import pytest
+from griffe import load_extensions, temporary_visited_module, temporary_visited_package
+
+from griffe_warnings_deprecated import WarningsDeprecatedExtension, deprecation_info
+
+
+@pytest.mark.parametrize(
+    ("decorator", "expected"),
+    [
+        (
+            (
+                "from deprecation import deprecated\n"
+                '@deprecated(deprecated_in="1.0", removed_in="2.0", details="Use g.")'
+            ),
+            {"since": "1.0", "message": "Use g.\n\nIt will be removed in 2.0."},
+        ),
+        ('import deprecation\n@deprecation.deprecated("1.0")', {"since": "1.0"}),
+        ("from deprecated import deprecated\n@deprecated", {"message": ""}),
+        ('from deprecated import deprecated\n@deprecated("Use g.")', {"message": "Use g."}),
+        (
+            'from deprecated.sphinx import deprecated\n@deprecated(version="1.2", reason="Use g.")',
+            {"since": "1.2", "message": "Use g."},
+        ),
+        (
+            'from pandas.util._decorators import deprecate_kwarg\n@deprecate_kwarg("old", "new")',
+            {"params": {"old": (None, "new")}},
+        ),
+        (
+            (
+                "from pandas.util._decorators import deprecate_kwarg\n"
+                '@deprecate_kwarg(old_arg_name="a", new_arg_name=None)'
+            ),
+            {"params": {"a": (None, None)}},
+        ),
+    ],
+)
+def test_builtin_parsers(decorator: str, expected: dict[str, Any]) -> None:
+    """Parse the decorators of common deprecation libraries.
+
+    Parameters:
+        decorator: Import and decorator lines (parametrized).
+        expected: Expected deprecation data (parametrized).
+    """
+    extension = WarningsDeprecatedExtension()
+    with temporary_visited_module(f"{decorator}\ndef f(a, b): ...\n", extensions=load_extensions(extension)):
+        pass
+    [obj] = extension._deprecated_objects
+    assert deprecation_info(obj).as_dict() == expected  # type: ignore[union-attr]
+
+
+def parse_custom(args: list[Any], kwargs: dict[str, Any]) -> dict[str, Any] | None:
+    """Parse `@custom.obsolete(version, note=...)`.
+
+    Parameters:
+        args: Positional arguments.
+        kwargs: Keyword arguments.
+
+    Returns:
+        The deprecation data.
+    """
+    return {"since": args[0], "message": kwargs.get("note")}
+
+
+@pytest.mark.parametrize("parser", [parse_custom, partial(parse_custom), "tests.test_parsers:parse_custom"])
+def test_configured_parsers(parser: Any) -> None:
+    """Register parsers through the `parsers` option.
+
+    Parameters:
+        parser: The parser or its import path (parametrized).
+    """
+    code = 'import custom\n@custom.obsolete("3.0", note="Gone.", level=x)\ndef f(): ...\n'
+    extension = WarningsDeprecatedExtension(parsers={"custom.obsolete": parser})
+    assert "custom.obsolete" in extension.decorators
+    with temporary_visited_module(code, extensions=load_extensions(extension)) as module:
+        assert module["f"].deprecated.startswith("`f` is deprecated since 3.0")
+        assert module["f"].deprecated.endswith("Gone.")
+
+
+@pytest.mark.parametrize(
+    "decorator",
+    ["from deprecated import deprecated\n@deprecated", "import deprecation\n@deprecation.deprecated()"],
+)
+def test_bare_decorators(decorator: str) -> None:
+    """Render a default text for decorators without message, so that deprecations propagate.
+
+    Parameters:
+        decorator: Import and decorator lines (parametrized).
+    """
+    modules = {
+        "__init__.py": "",
+        "old.py": f"{decorator}\nclass A:\n    def m(self): ...\n",
+        "new.py": "from pkg.old import A\nclass B(A): ...\n",
+    }
+    extension = WarningsDeprecatedExtension(cascade=True, inherited=True)
+    with temporary_visited_package("pkg", modules, extensions=load_extensions(extension)) as package:
+        assert package["old.A"].deprecated == "`A` is deprecated."
+        assert package["old.A"].docstring.parsed[0].value.contents == "`A` is deprecated."
+        assert "deprecated-parent" in package["old.A.m"].labels
+        assert package["new.B"].docstring.parsed[0].value.contents == "Inherits from deprecated class [`A`][pkg.old.A]."
+    [record] = extension.records("pkg")
+    assert record["message"] == "`A` is deprecated."
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    ['"Use g.", stacklevel={[1]: 2}', '"Use g.", stacklevel={{1}: 2}'],
+)
+def test_unusable_literals(arguments: str) -> None:
+    """Ignore decorator arguments that are valid code but not usable literals.
+
+    Parameters:
+        arguments: Decorator arguments (parametrized).
+    """
+    code = f"import warnings\n@warnings.deprecated({arguments})\ndef f(): ...\n"
+    with temporary_visited_module(code, extensions=load_extensions(WarningsDeprecatedExtension)) as module:
+        assert module["f"].deprecated == "Use g."
+
+
+@pytest.mark.parametrize(
+    ("decorator", "expected"),
+    [
+        (
+            'import braian.utils\n@braian.utils.deprecated(since="1.0", alternatives="x.y")',
+            {"since": "1.0"},
+        ),
+        ("import braian.utils\n@braian.utils.deprecated(since=1.0, message=2)", {"since": "1.0"}),
+        ("from deprecated import deprecated\n@deprecated(reason=123)", {"message": ""}),
+        ('from deprecated import deprecated\n@deprecated(reason=123, version="1.2")', {"since": "1.2"}),
+    ],
+)
+def test_mistyped_arguments(decorator: str, expected: dict[str, Any]) -> None:
+    """Ignore arguments of the wrong type instead of rendering them.
+
+    Parameters:
+        decorator: Import and decorator lines (parametrized).
+        expected: Expected deprecation data (parametrized).
+    """
+    extension = WarningsDeprecatedExtension()
+    with temporary_visited_module(f"{decorator}\ndef f(): ...\n", extensions=load_extensions(extension)):
+        pass
+    [obj] = extension._deprecated_objects
+    assert deprecation_info(obj).as_dict() == expected  # type: ignore[union-attr]
@@ -0,0 +1,91 @@
+"""Tests for the `policy` module."""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+from griffe import load_extensions, temporary_visited_package
+
+from griffe_warnings_deprecated import WarningsDeprecatedExtension
+from griffe_warnings_deprecated.policy import RemovalPolicy
+
+
+@pytest.mark.parametrize(
+    ("current", "after", "part", "since", "expected"),
+    [
+        ("1.2.5", 1, "minor", "1.2", ("1.3", False)),
+        ("1.3.0", 1, "minor", "1.2", ("1.3", True)),
+        ("2.0", 2, "minor", "1.2.4", ("1.4", True)),
+        ("1.9", 1, "major", "1.2", ("2", False)),
+        ("1.2.3", 1, "patch", "v1.2.2rc1", ("1.2.3", True)),
+        ("1.2", 1, "minor", "unreleased", None),
+        ("1.3", 1, "minor", 1.2, ("1.3", True)),
+    ],
+)
+def test_deadline(current: str, after: int, part: str, since: str | float, expected: tuple[str, bool] | None) -> None:
+    """Compute removal versions.
+
+    Parameters:
+        current: The current version (parametrized).
+        after: Number of versions (parametrized).
+        part: Version part (parametrized).
+        since: Deprecation version, possibly a number (parametrized).
+        expected: Expected removal version and status (parametrized).
+    """
+    assert RemovalPolicy(current, after, part).deadline(since) == expected
+
+
+def test_invalid_policy() -> None:
+    """Reject invalid versions and parts."""
+    with pytest.raises(ValueError, match="current version"):
+        RemovalPolicy("next")
+    with pytest.raises(ValueError, match="part"):
+        RemovalPolicy("1.0", part="micro")
+
+
+def test_report_overdue_deprecations(caplog: pytest.LogCaptureFixture) -> None:
+    """Warn about objects and parameters past their removal version.
+
+    Parameters:
+        caplog: Pytest fixture to capture logs.
+    """
+    code = """
+    from braian.utils import deprecated
+
+    @deprecated(since="1.0")
+    def old(): ...
+
+    @deprecated(since="1.4")
+    def recent(): ...
+
+    @deprecated(since="1.1", params=["a"])
+    def params(a, b): ...
+    """
+    extension = WarningsDeprecatedExtension(removal_policy={"current_version": "1.4.1", "after": 2})
+    with (
+        caplog.at_level(logging.WARNING),
+        temporary_visited_package("package", {"__init__.py": code}, extensions=load_extensions(extension)),
+    ):
+        pass
+    messages = [record.getMessage() for record in caplog.records]
+    assert len(messages) == 2
+    assert "package.old is deprecated since 1.0 and should have been removed in 1.2" in messages[0]
+    assert "parameter 'a' of package.params is deprecated since 1.1 and should have been removed in 1.3" in messages[1]
+
+
+def test_numeric_versions(caplog: pytest.LogCaptureFixture) -> None:
+    """Accept versions written as numbers.
+
+    Parameters:
+        caplog: Pytest fixture to capture logs.
+    """
+    code = "from braian.utils import deprecated\n@deprecated(since=1.0)\ndef old(): ...\n"
+    extension = WarningsDeprecatedExtension(removal_policy={"current_version": "1.4"})
+    with (
+        caplog.at_level(logging.WARNING),
+        temporary_visited_package("package", {"__init__.py": code}, extensions=load_extensions(extension)),
+    ):
+        pass
+    [message] = [record.getMessage() for record in caplog.records]
+    assert "package.old is deprecated since 1.0 and should have been removed in 1.1" in message
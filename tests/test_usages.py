@@ -0,0 +1,89 @@
+"""Tests for the `usages` module."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from griffe_warnings_deprecated import cli
+from griffe_warnings_deprecated.usages import DeprecationIndex, find_usages
+
+INDEX = DeprecationIndex(
+    ["lib.old", "lib.sub.Old", "lib.sub.New.legacy"],
+    {"lib.sub.New": frozenset({"flag"})},
+)
+
+
+def _found(source: str) -> list[tuple[str, str, int]]:
+    return [(usage["path"], usage["kind"], usage["lineno"]) for usage in INDEX.find(source)]
+
+
+def test_find_imports_and_accesses() -> None:
+    """Resolve imports, aliases and attribute chains to deprecated paths."""
+    source = """\
+import lib
+import lib.sub as s
+from lib import old
+from lib.sub import New as N
+lib.old()
+s.Old().run()
+N(flag=True)
+N(other=True).current
+N.legacy
+"""
+    assert _found(source) == [
+        ("lib.old", "import", 3),
+        ("lib.old", "access", 5),
+        ("lib.sub.Old", "access", 6),
+        ("lib.sub.New", "parameter", 7),
+        ("lib.sub.New.legacy", "access", 9),
+    ]
+
+
+def test_ignore_unrelated_modules() -> None:
+    """Ignore modules that don't refer to the library."""
+    assert _found("import other\nother.old()\nold = 1\nold\n") == []
+    assert _found("from .lib import old\nold()\n") == []
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_usages_command(tmp_path: Path, workers: int, capsys: pytest.CaptureFixture) -> None:
+    """Scan a source tree with the `usages` command.
+
+    Parameters:
+        tmp_path: Pytest fixture.
+        workers: Number of worker processes (parametrized).
+        capsys: Pytest fixture to capture output.
+    """
+    index = tmp_path / "index.jsonl"
+    index.write_text(json.dumps({"path": "lib.old", "message": "old", "params": {}}) + "\n", encoding="utf8")
+    tree = tmp_path / "project"
+    (tree / ".hidden").mkdir(parents=True)
+    (tree / ".hidden" / "a.py").write_text("from lib import old\n", encoding="utf8")
+    (tree / "a.py").write_text("import lib\nlib.old()\n", encoding="utf8")
+    (tree / "b.py").write_text("from lib import old\n", encoding="utf8")
+    (tree / "c.py").write_text("import lib\nlib(\n", encoding="utf8")
+    assert cli.main(["usages", str(index), str(tree), "-j", str(workers)]) == 1
+    captured = capsys.readouterr()
+    usages = [json.loads(line) for line in captured.out.splitlines()]
+    assert [(Path(usage["filepath"]).name, usage["lineno"]) for usage in usages] == [("a.py", 2), ("b.py", 1)]
+    assert "could not scan" in captured.err
+    assert "c.py" in captured.err
+
+
+def test_find_usages_streams_results(tmp_path: Path) -> None:
+    """Yield one result per file, in file order.
+
+    Parameters:
+        tmp_path: Pytest fixture.
+    """
+    for name in "abc":
+        (tmp_path / f"{name}.py").write_text("import lib.old\n", encoding="utf8")
+    results = find_usages(INDEX, [tmp_path], workers=1)
+    filepath, usages, error = next(results)
+    assert Path(filepath).name == "a.py"
+    assert error is None
+    assert [usage["kind"] for usage in usages] == ["import"]
+    assert [Path(filepath).name for filepath, _, _ in results] == ["b.py", "c.py"]